@@ -5,6 +5,7 @@
 
 import os
 import io
+import threading
 import barcode
 from barcode.writer import ImageWriter
 from PIL import Image, ImageDraw, ImageFont
@@ -281,7 +282,7 @@ class BarcodeGenerator:
             raise ValueError(f"无效的颜色值: {str(e)}")
     
     def save_barcode(self, barcode_type: str, data: str, file_path: str, 
-                    options: Optional[Dict[str, Any]] = None) -> bool:
+                    options: Optional[Dict[str, Any]] = None, check_dir: bool = True) -> bool:
         """
         生成并保存条形码到文件
         
@@ -290,6 +291,7 @@ class BarcodeGenerator:
             data (str): 条形码数据
             file_path (str): 保存文件路径
             options (Optional[Dict[str, Any]]): 生成选项
+            check_dir (bool): 是否检查并创建保存目录
             
         Returns:
             bool: 操作是否成功
@@ -315,8 +317,8 @@ class BarcodeGenerator:
             if not is_valid:
                 raise ValueError(error_msg)
             
-            # 确保目录存在
-            dir_path = os.path.dirname(file_path)
+            # 确保目录存在（批量生成时由调用方统一检查一次）
+            dir_path = os.path.dirname(file_path) if check_dir else ''
             if dir_path and not os.path.exists(dir_path):
                 try:
                     os.makedirs(dir_path, exist_ok=True)
@@ -335,7 +337,14 @@ class BarcodeGenerator:
             
             # 保存图像
             try:
-                barcode_image.save(file_path)
+                try:
+                    barcode_image.save(file_path)
+                except FileNotFoundError:
+                    # 输出目录可能在确认存在后被删除，重新创建后重试一次
+                    save_dir = os.path.dirname(file_path)
+                    if not save_dir or not FileHandler.ensure_dir_exists(save_dir, refresh=True):
+                        raise
+                    barcode_image.save(file_path)
                 
                 # 验证文件是否保存成功
                 if not os.path.exists(file_path):
@@ -368,7 +377,8 @@ class BarcodeGenerator:
     
     def batch_generate_barcodes(self, barcode_type: str, data_list: list, output_dir: str, 
                               file_prefix: str = 'barcode', file_format: str = 'PNG',
-                              options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                              options: Optional[Dict[str, Any]] = None,
+                              cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         批量生成条形码
         
@@ -379,6 +389,7 @@ class BarcodeGenerator:
             file_prefix (str): 文件名前缀
             file_format (str): 文件格式
             options (Optional[Dict[str, Any]]): 生成选项
+            cancel_event (Optional[threading.Event]): 取消事件，设置后停止处理剩余数据
             
         Returns:
             Dict[str, Any]: 批量生成结果
@@ -389,20 +400,26 @@ class BarcodeGenerator:
             'errors': []
         }
         
-        # 确保输出目录存在
-        if not FileHandler.ensure_dir_exists(output_dir):
+        # 确保输出目录存在（每批只检查一次，目录可能在上一批之后被删除，不使用缓存）
+        if not FileHandler.ensure_dir_exists(output_dir, refresh=True):
             app_logger.error(f"无法创建输出目录: {output_dir}")
             result['errors'].append(f"无法创建输出目录: {output_dir}")
             return result
         
         for i, data in enumerate(data_list):
+            # 收到取消请求时在处理下一条数据前停止
+            if cancel_event is not None and cancel_event.is_set():
+                result['cancelled'] = True
+                app_logger.info(f"批量生成条形码已取消: 已处理{i}/{len(data_list)}条")
+                break
+            
             try:
                 # 生成文件名
                 filename = f"{file_prefix}_{i+1}.{file_format.lower()}"
                 file_path = os.path.join(output_dir, filename)
                 
                 # 生成并保存条形码
-                if self.save_barcode(barcode_type, data, file_path, options):
+                if self.save_barcode(barcode_type, data, file_path, options, check_dir=False):
                     result['success'] += 1
                     app_logger.info(f"批量生成条形码成功: {file_path}")
                 else:
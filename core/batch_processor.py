@@ -6,6 +6,7 @@
 import os
 import csv
 import json
+import threading
 import pandas as pd
 from typing import List, Dict, Any, Optional, Tuple, Union
 from utils.logger import app_logger
@@ -249,7 +250,8 @@ class BatchProcessor:
     
     def batch_generate_barcodes(self, data_source: Union[str, List[str]], output_dir: str, barcode_type: str,
                                file_prefix: str = 'barcode', file_format: str = 'PNG',
-                               data_column: str = None, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                               data_column: str = None, options: Optional[Dict[str, Any]] = None,
+                               cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         批量生成条形码
         
@@ -261,6 +263,7 @@ class BatchProcessor:
             file_format (str): 文件格式
             data_column (str): 数据列名（对于CSV文件）
             options (Optional[Dict[str, Any]]): 生成选项
+            cancel_event (Optional[threading.Event]): 取消事件，设置后停止处理剩余数据
             
         Returns:
             Dict[str, Any]: 批量生成结果
@@ -310,7 +313,7 @@ class BatchProcessor:
             
             # 批量生成条形码
             result = self.barcode_generator.batch_generate_barcodes(
-                barcode_type, data_list, output_dir, file_prefix, file_format, options
+                barcode_type, data_list, output_dir, file_prefix, file_format, options, cancel_event
             )
             
             # 记录处理结果
@@ -337,7 +340,8 @@ class BatchProcessor:
     
     def batch_generate_qrcodes(self, data_source: Union[str, List[str]], output_dir: str,
                              file_prefix: str = 'qrcode', file_format: str = 'PNG',
-                             data_column: str = None, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                             data_column: str = None, options: Optional[Dict[str, Any]] = None,
+                             cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         批量生成二维码
         
@@ -348,6 +352,7 @@ class BatchProcessor:
             file_format (str): 文件格式
             data_column (str): 数据列名（对于CSV文件）
             options (Optional[Dict[str, Any]]): 生成选项
+            cancel_event (Optional[threading.Event]): 取消事件，设置后停止处理剩余数据
             
         Returns:
             Dict[str, Any]: 批量生成结果
@@ -396,7 +401,7 @@ class BatchProcessor:
             
             # 批量生成二维码
             result = self.qrcode_generator.batch_generate_qrcodes(
-                data_list, output_dir, file_prefix, file_format, options
+                data_list, output_dir, file_prefix, file_format, options, cancel_event
             )
             
             # 记录处理结果
@@ -5,6 +5,8 @@
 
 import os
 import io
+import shutil
+import threading
 import qrcode
 from qrcode.constants import ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q, ERROR_CORRECT_H
 from PIL import Image, ImageDraw, ImageFont
@@ -617,7 +619,8 @@ class QRCodeGenerator:
             app_logger.error(f"加载Logo失败: {str(e)}")
             return None
     
-    def save_qrcode(self, data: str, file_path: str, options: Optional[Dict[str, Any]] = None) -> bool:
+    def save_qrcode(self, data: str, file_path: str, options: Optional[Dict[str, Any]] = None,
+                    check_dir: bool = True) -> bool:
         """
         保存二维码到文件
         
@@ -625,6 +628,7 @@ class QRCodeGenerator:
             data: 二维码数据
             file_path: 保存路径
             options: 生成选项
+            check_dir: 是否检查并创建保存目录
             
         Returns:
             bool: 是否成功保存
@@ -642,8 +646,8 @@ class QRCodeGenerator:
             if not file_path:
                 raise ValueError("保存路径不能为空")
             
-            # 确保目录存在
-            dir_path = os.path.dirname(file_path)
+            # 确保目录存在（批量生成时由调用方统一检查一次）
+            dir_path = os.path.dirname(file_path) if check_dir else ''
             if dir_path and not os.path.exists(dir_path):
                 try:
                     os.makedirs(dir_path, exist_ok=True)
@@ -662,7 +666,14 @@ class QRCodeGenerator:
             
             # 保存图像
             try:
-                qr_image.save(file_path)
+                try:
+                    qr_image.save(file_path)
+                except FileNotFoundError:
+                    # 输出目录可能在确认存在后被删除，重新创建后重试一次
+                    save_dir = os.path.dirname(file_path)
+                    if not save_dir or not FileHandler.ensure_dir_exists(save_dir, refresh=True):
+                        raise
+                    qr_image.save(file_path)
                 
                 # 验证文件是否保存成功
                 if not os.path.exists(file_path):
@@ -695,7 +706,8 @@ class QRCodeGenerator:
     
     def batch_generate_qrcodes(self, data_list: list, output_dir: str, 
                               file_prefix: str = 'qrcode', file_format: str = 'PNG',
-                              options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                              options: Optional[Dict[str, Any]] = None,
+                              cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         批量生成二维码
         
@@ -705,6 +717,7 @@ class QRCodeGenerator:
             file_prefix (str): 文件名前缀
             file_format (str): 文件格式
             options (Optional[Dict[str, Any]]): 生成选项
+            cancel_event (Optional[threading.Event]): 取消事件，设置后停止处理剩余数据
             
         Returns:
             Dict[str, Any]: 批量生成结果
@@ -715,20 +728,37 @@ class QRCodeGenerator:
             'errors': []
         }
         
-        # 确保输出目录存在
-        if not FileHandler.ensure_dir_exists(output_dir):
+        # 确保输出目录存在（每批只检查一次，目录可能在上一批之后被删除，不使用缓存）
+        if not FileHandler.ensure_dir_exists(output_dir, refresh=True):
             app_logger.error(f"无法创建输出目录: {output_dir}")
             result['errors'].append(f"无法创建输出目录: {output_dir}")
             return result
         
+        # 同一批次内选项不变，相同数据只需编码一次，重复数据直接复制已生成的文件
+        generated_files = {}
+        
         for i, data in enumerate(data_list):
+            # 收到取消请求时在处理下一条数据前停止
+            if cancel_event is not None and cancel_event.is_set():
+                result['cancelled'] = True
+                app_logger.info(f"批量生成二维码已取消: 已处理{i}/{len(data_list)}条")
+                break
+            
             try:
                 # 生成文件名
                 filename = f"{file_prefix}_{i+1}.{file_format.lower()}"
                 file_path = os.path.join(output_dir, filename)
                 
+                # 重复数据复用已生成的二维码文件
+                if data in generated_files:
+                    shutil.copyfile(generated_files[data], file_path)
+                    result['success'] += 1
+                    app_logger.info(f"批量生成二维码成功(复用): {file_path}")
+                    continue
+                
                 # 生成并保存二维码
-                if self.save_qrcode(data, file_path, options):
+                if self.save_qrcode(data, file_path, options, check_dir=False):
+                    generated_files[data] = file_path
                     result['success'] += 1
                     app_logger.info(f"批量生成二维码成功: {file_path}")
                 else:
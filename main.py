@@ -4,14 +4,24 @@
 
 import sys
 import os
+import importlib.util
 import traceback
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from ui.main_window import MainWindow
 from utils.logger import app_logger
 from utils.file_handler import FileHandler
 from utils.exception_handler import global_exception_handler
 
+# 必要的依赖项: (模块名, pip包名, 显示名称)
+_REQUIRED_DEPS = (
+    ('PyQt5', 'PyQt5', 'PyQt5'),
+    ('barcode', 'python-barcode', 'python-barcode'),
+    ('qrcode', 'qrcode[pil]', 'qrcode'),
+    ('pandas', 'pandas', 'pandas'),
+    ('PIL', 'Pillow', 'Pillow'),
+)
+
 
 def setup_application():
     """
@@ -28,6 +38,10 @@ def setup_application():
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
         
+        # 合并高频的鼠标移动和数位板事件，减少需要处理的事件数量
+        QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+        QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
+        
         # 创建应用程序
         app = QApplication(sys.argv)
         app.setApplicationName("条形码和二维码生成器")
@@ -51,41 +65,13 @@ def check_dependencies():
     try:
         missing_deps = []
         
-        # 检查必要的库
-        try:
-            import PyQt5
-            app_logger.debug("PyQt5 依赖检查通过")
-        except ImportError:
-            missing_deps.append("PyQt5")
-            app_logger.warning("PyQt5 依赖缺失")
-        
-        try:
-            import barcode
-            app_logger.debug("python-barcode 依赖检查通过")
-        except ImportError:
-            missing_deps.append("python-barcode")
-            app_logger.warning("python-barcode 依赖缺失")
-        
-        try:
-            import qrcode
-            app_logger.debug("qrcode 依赖检查通过")
-        except ImportError:
-            missing_deps.append("qrcode[pil]")
-            app_logger.warning("qrcode 依赖缺失")
-        
-        try:
-            import pandas
-            app_logger.debug("pandas 依赖检查通过")
-        except ImportError:
-            missing_deps.append("pandas")
-            app_logger.warning("pandas 依赖缺失")
-        
-        try:
-            import PIL
-            app_logger.debug("Pillow 依赖检查通过")
-        except ImportError:
-            missing_deps.append("Pillow")
-            app_logger.warning("Pillow 依赖缺失")
+        # 检查必要的库（只查找模块而不导入，避免在启动时提前加载pandas等大型库）
+        for module_name, package_name, display_name in _REQUIRED_DEPS:
+            if importlib.util.find_spec(module_name) is not None:
+                app_logger.debug(f"{display_name} 依赖检查通过")
+            else:
+                missing_deps.append(package_name)
+                app_logger.warning(f"{display_name} 依赖缺失")
         
         # 如果有缺失的依赖项，显示错误信息
         if missing_deps:
@@ -227,6 +213,8 @@ def main():
         try:
             main_window = MainWindow()
             main_window.show()
+            # 进入事件循环后先处理首批显示和绘制事件
+            QTimer.singleShot(0, app.processEvents)
             app_logger.info("主窗口创建并显示成功")
         except Exception as e:
             error_msg = f"创建主窗口失败: {str(e)}"
@@ -0,0 +1,270 @@
+"""
+文件处理工具模块测试
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from functools import partial
+from unittest import mock
+
+from utils import file_handler
+from utils.file_handler import FileHandler
+
+
+def _case_insensitive_exists(path):
+    """模拟不区分大小写的文件系统（Windows、默认配置的macOS）"""
+    dir_path, name = os.path.split(path)
+    try:
+        names = os.listdir(dir_path or '.')
+    except FileNotFoundError:
+        return False
+    return name.lower() in {n.lower() for n in names}
+
+
+class GetUniqueFilenameTest(unittest.TestCase):
+    """get_unique_filename测试"""
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def _touch(self, name):
+        with open(os.path.join(self.dir_path, name), 'w'):
+            pass
+
+    def test_returns_base_name_when_free(self):
+        base = os.path.join(self.dir_path, 'qr')
+        self.assertEqual(FileHandler.get_unique_filename(base, 'png'), base + '.png')
+
+    def test_skips_existing_names(self):
+        base = os.path.join(self.dir_path, 'qr')
+        for _ in range(3):
+            file_path = FileHandler.get_unique_filename(base, 'png')
+            self.assertFalse(os.path.exists(file_path))
+            self._touch(os.path.basename(file_path))
+        self.assertEqual(FileHandler.get_unique_filename(base, 'png'), base + '_3.png')
+
+    def test_case_insensitive_filesystem(self):
+        self._touch('QR.png')
+        base = os.path.join(self.dir_path, 'qr')
+        with mock.patch('os.path.exists', side_effect=_case_insensitive_exists):
+            file_path = FileHandler.get_unique_filename(base, 'png')
+        self.assertEqual(file_path, base + '_1.png')
+
+    def test_saving_does_not_rescan_directory(self):
+        base = os.path.join(self.dir_path, 'qr')
+        with mock.patch('os.scandir', wraps=os.scandir) as scandir:
+            for _ in range(20):
+                file_path = FileHandler.get_unique_filename(base, 'txt')
+                self.assertTrue(FileHandler.save_file(file_path, 'x', quiet=True))
+        self.assertEqual(scandir.call_count, 1)
+        self.assertEqual(len(os.listdir(self.dir_path)), 20)
+
+    def test_reuses_number_of_deleted_file(self):
+        base = os.path.join(self.dir_path, 'qr')
+        for _ in range(3):
+            FileHandler.save_file(FileHandler.get_unique_filename(base, 'txt'), 'x', quiet=True)
+        os.remove(base + '_1.txt')
+        # 目录修改时间的精度可能较低，确保能识别到目录已变化
+        FileHandler._invalidate_stat(self.dir_path)
+        st = os.stat(self.dir_path)
+        os.utime(self.dir_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        self.assertEqual(FileHandler.get_unique_filename(base, 'txt'), base + '_1.txt')
+
+    def test_directory_created_after_first_call(self):
+        dir_path = os.path.join(self.dir_path, 'sub')
+        base = os.path.join(dir_path, 'x')
+        self.assertEqual(FileHandler.get_unique_filename(base, 'png'), base + '.png')
+        # 目录在缓存有效期内由外部创建
+        os.makedirs(dir_path)
+        with open(base + '.png', 'w'):
+            pass
+        self.assertEqual(FileHandler.get_unique_filename(base, 'png'), base + '_1.png')
+
+
+class EnsureDirExistsTest(unittest.TestCase):
+    """ensure_dir_exists测试"""
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def test_directory_created_externally(self):
+        dir_path = os.path.join(self.dir_path, 'sub')
+        # 先缓存"路径不存在"的结果，再由外部创建目录
+        self.assertIsNone(FileHandler._stat(dir_path))
+        os.makedirs(dir_path)
+        self.assertTrue(FileHandler.ensure_dir_exists(dir_path))
+
+    def test_refresh_recreates_deleted_directory(self):
+        dir_path = os.path.join(self.dir_path, 'out')
+        self.assertTrue(FileHandler.ensure_dir_exists(dir_path))
+        shutil.rmtree(dir_path)
+        self.assertTrue(FileHandler.ensure_dir_exists(dir_path, refresh=True))
+        self.assertTrue(os.path.isdir(dir_path))
+
+    def test_save_into_deleted_directory(self):
+        dir_path = os.path.join(self.dir_path, 'out')
+        file_path = os.path.join(dir_path, 'a.txt')
+        self.assertTrue(FileHandler.save_file(file_path, 'a', quiet=True))
+        # 目录已记录在缓存中，之后被外部删除
+        shutil.rmtree(dir_path)
+        self.assertTrue(FileHandler.save_file(file_path, 'b', quiet=True))
+        self.assertEqual(FileHandler.read_file(file_path, quiet=True), 'b')
+
+    def test_existing_file_is_rejected(self):
+        file_path = os.path.join(self.dir_path, 'file')
+        with open(file_path, 'w'):
+            pass
+        self.assertFalse(FileHandler.ensure_dir_exists(file_path))
+
+
+class ReadFileTest(unittest.TestCase):
+    """read_file测试"""
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def test_regular_file(self):
+        file_path = os.path.join(self.dir_path, 'a.txt')
+        with open(file_path, 'wb') as f:
+            f.write('条码\r\n123'.encode('utf-8'))
+        self.assertEqual(FileHandler.read_file(file_path, quiet=True), '条码\n123')
+
+    @unittest.skipUnless(os.path.exists('/proc/self/status'), "需要/proc文件系统")
+    def test_zero_size_file(self):
+        # /proc下的文件报告大小为0，但可以读出内容
+        self.assertIn('Name:', FileHandler.read_file('/proc/self/status', quiet=True))
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), "需要命名管道")
+    def test_fifo(self):
+        fifo_path = os.path.join(self.dir_path, 'fifo')
+        os.mkfifo(fifo_path)
+
+        def write():
+            with open(fifo_path, 'w', encoding='utf-8') as f:
+                f.write('abc')
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            self.assertEqual(FileHandler.read_file(fifo_path, quiet=True), 'abc')
+        finally:
+            writer.join()
+
+
+class ReadCsvTest(unittest.TestCase):
+    """read_csv测试，结果应与csv.DictReader一致"""
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def _write(self, content):
+        file_path = os.path.join(self.dir_path, 'data.csv')
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            f.write(content)
+        return file_path
+
+    def _read(self, file_path):
+        with open(file_path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def _assert_matches_dictreader(self, content):
+        file_path = self._write(content)
+        self.assertEqual(FileHandler.read_csv(file_path), self._read(file_path))
+
+    def test_duplicate_header(self):
+        self._assert_matches_dictreader('col,col\n1,2\n')
+
+    def test_extra_fields(self):
+        self._assert_matches_dictreader('a,b\n1,2,3\n4,5\n')
+
+    def test_missing_fields(self):
+        self._assert_matches_dictreader('a,b\n1\n')
+
+    def test_whitespace_only_line(self):
+        self._assert_matches_dictreader('a,b\n1,2\n   \n\n3,4\n')
+
+    def test_large_file(self):
+        # 结果不应随文件大小变化
+        self._assert_matches_dictreader('a,b\n' + '1,2\n   \n' * (200 << 10))
+
+
+class SaveStatsTest(unittest.TestCase):
+    """文件保存统计测试"""
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+        FileHandler.flush_stats()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def test_all_save_methods_are_counted(self):
+        join = partial(os.path.join, self.dir_path)
+        self.assertTrue(FileHandler.save_file(join('a.txt'), 'a', quiet=True))
+        self.assertTrue(FileHandler.save_csv(join('b.csv'), [{'x': 1}], quiet=True))
+        self.assertTrue(FileHandler.save_csv_rows(join('c.csv'), ['x'], [[1]], quiet=True))
+        self.assertTrue(FileHandler.save_json(join('d.json'), {'x': 1}, quiet=True))
+        self.assertEqual(FileHandler.flush_stats(), {'ok': 4, 'fail': 0})
+
+    def test_quiet_skips_success_log(self):
+        with mock.patch('utils.file_handler.app_logger') as logger:
+            FileHandler.save_csv_rows(os.path.join(self.dir_path, 'c.csv'), ['x'], [[1]], quiet=True)
+            FileHandler.save_json(os.path.join(self.dir_path, 'd.json'), [], quiet=True)
+        logger.info.assert_not_called()
+
+
+class SaveJsonTest(unittest.TestCase):
+    """save_json测试，安装和未安装orjson时结果应一致"""
+
+    DATA = {1: 'a', 'big': 2 ** 70, 'nan': float('nan'), 'inf': [float('inf')], 'text': '条码'}
+    EXPECTED = {'1': 'a', 'big': 2 ** 70, 'nan': None, 'inf': [None], 'text': '条码'}
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def _save_and_load(self):
+        file_path = os.path.join(self.dir_path, 'data.json')
+        self.assertTrue(FileHandler.save_json(file_path, self.DATA, quiet=True))
+        with open(file_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_with_orjson(self):
+        if file_handler.orjson is None:
+            self.skipTest("orjson未安装")
+        self.assertEqual(self._save_and_load(), self.EXPECTED)
+
+    def test_without_orjson(self):
+        with mock.patch('utils.file_handler.orjson', None):
+            self.assertEqual(self._save_and_load(), self.EXPECTED)
+
+    def test_same_bytes_with_and_without_orjson(self):
+        if file_handler.orjson is None:
+            self.skipTest("orjson未安装")
+        data = {1: [1.5, None, True], 'text': '条码', 'nested': {'nan': float('nan')}}
+        content = FileHandler._dumps_json(data)
+        with mock.patch('utils.file_handler.orjson', None):
+            self.assertEqual(FileHandler._dumps_json(data), content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+日志记录工具模块测试
+"""
+
+import logging
+import logging.handlers
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from utils.logger import Logger
+
+
+class LoggerCloseTest(unittest.TestCase):
+    """Logger.close测试"""
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.log_dir, ignore_errors=True)
+        self.logger = Logger("LoggerCloseTest", log_dir=self.log_dir)
+        self.addCleanup(self._remove_handlers)
+
+    def _remove_handlers(self):
+        for handler in list(self.logger.logger.handlers):
+            self.logger.logger.removeHandler(handler)
+            handler.close()
+
+    def test_records_after_close_are_not_dropped(self):
+        self.logger.close()
+        handlers = self.logger.logger.handlers
+        self.assertFalse(any(isinstance(h, logging.handlers.QueueHandler) for h in handlers))
+        self.assertTrue(any(isinstance(h, logging.handlers.RotatingFileHandler) for h in handlers))
+
+        console = next(h for h in handlers if type(h) is logging.StreamHandler)
+        with mock.patch.object(console, 'emit') as emit:
+            self.logger.info("after close")
+        emit.assert_called_once()
+        self.assertEqual(emit.call_args[0][0].getMessage(), "after close")
+
+    def test_close_twice(self):
+        self.logger.close()
+        self.logger.close()
+        self.assertEqual(len(self.logger.logger.handlers), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
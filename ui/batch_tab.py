@@ -4,6 +4,11 @@
 """
 
 import os
+import logging
+import threading
+import traceback
+from functools import partial
+from types import SimpleNamespace
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                             QLabel, QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox,
                             QPushButton, QCheckBox, QColorDialog, QFileDialog,
@@ -11,24 +16,28 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                             QFrame, QSizePolicy, QRadioButton, QButtonGroup,
                             QProgressBar, QTabWidget, QTableWidget, QTableWidgetItem,
                             QHeaderView, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal, QSize, QThread, pyqtSlot
+from PyQt5.QtCore import (Qt, pyqtSignal, QSize, QObject, QRunnable, QThreadPool,
+                          pyqtSlot, QStringListModel)
 from PyQt5.QtGui import QPixmap, QFont, QColor
 from core.batch_processor import BatchProcessor
 from utils.logger import app_logger
 from utils.file_handler import FileHandler
 
 
-class BatchProcessThread(QThread):
-    """批量处理线程"""
+class BatchProcessSignals(QObject):
+    """批量处理任务的信号（QRunnable不是QObject，信号需单独定义）"""
     
-    # 定义信号
     progress_updated = pyqtSignal(int, int)  # 当前进度, 总数
     process_completed = pyqtSignal(dict)  # 处理结果
     status_updated = pyqtSignal(str)  # 状态消息
+
+
+class BatchProcessWorker(QRunnable):
+    """批量处理任务，在QThreadPool的工作线程中运行"""
     
     def __init__(self, processor, process_type, data_source, output_dir, **kwargs):
         """
-        初始化批量处理线程
+        初始化批量处理任务
         
         Args:
             processor: 批量处理器实例
@@ -38,17 +47,24 @@ class BatchProcessThread(QThread):
             **kwargs: 其他参数
         """
         super().__init__()
+        self.signals = BatchProcessSignals()
         self.processor = processor
         self.process_type = process_type
         self.data_source = data_source
         self.output_dir = output_dir
         self.kwargs = kwargs
         self.result = None
+        # 线程池中的任务无法强制终止，通过事件通知处理器在条目之间停止
+        self.cancel_event = threading.Event()
+    
+    def cancel(self):
+        """请求取消任务，当前条目处理完成后停止"""
+        self.cancel_event.set()
     
     def run(self):
         """运行批量处理"""
         try:
-            self.status_updated.emit("正在处理数据...")
+            self.signals.status_updated.emit("正在处理数据...")
             app_logger.info(f"开始批量处理: 类型={self.process_type}, 数据源={self.data_source}, 输出目录={self.output_dir}")
             
             # 验证输入参数
@@ -58,20 +74,17 @@ class BatchProcessThread(QThread):
             if not self.output_dir:
                 raise ValueError("输出目录为空")
             
-            # 确保输出目录存在
-            if not os.path.exists(self.output_dir):
-                os.makedirs(self.output_dir, exist_ok=True)
-                app_logger.info(f"创建输出目录: {self.output_dir}")
+            # 输出目录已在start_batch_process中创建并检查过权限
             
             if self.process_type == 'barcode':
                 app_logger.info("开始批量生成条形码")
                 self.result = self.processor.batch_generate_barcodes(
-                    self.data_source, self.output_dir, **self.kwargs
+                    self.data_source, self.output_dir, cancel_event=self.cancel_event, **self.kwargs
                 )
             else:  # qrcode
                 app_logger.info("开始批量生成二维码")
                 self.result = self.processor.batch_generate_qrcodes(
-                    self.data_source, self.output_dir, **self.kwargs
+                    self.data_source, self.output_dir, cancel_event=self.cancel_event, **self.kwargs
                 )
             
             # 验证结果
@@ -80,7 +93,7 @@ class BatchProcessThread(QThread):
             
             # 发送进度更新
             total = self.result.get('success', 0) + self.result.get('failed', 0)
-            self.progress_updated.emit(total, total)
+            self.signals.progress_updated.emit(total, total)
             
             # 记录处理结果
             success_count = self.result.get('success', 0)
@@ -95,37 +108,37 @@ class BatchProcessThread(QThread):
                     app_logger.warning(f"错误: {error}")
             
             # 发送完成信号
-            self.process_completed.emit(self.result)
+            self.signals.process_completed.emit(self.result)
             
         except ValueError as ve:
             error_msg = f"参数错误: {str(ve)}"
-            self.status_updated.emit(error_msg)
+            self.signals.status_updated.emit(error_msg)
             app_logger.error(error_msg)
             self.result = {'success': 0, 'failed': 0, 'errors': [error_msg]}
-            self.process_completed.emit(self.result)
+            self.signals.process_completed.emit(self.result)
             
         except FileNotFoundError as fnfe:
             error_msg = f"文件未找到: {str(fnfe)}"
-            self.status_updated.emit(error_msg)
+            self.signals.status_updated.emit(error_msg)
             app_logger.error(error_msg)
             self.result = {'success': 0, 'failed': 0, 'errors': [error_msg]}
-            self.process_completed.emit(self.result)
+            self.signals.process_completed.emit(self.result)
             
         except PermissionError as pe:
             error_msg = f"权限错误: {str(pe)}"
-            self.status_updated.emit(error_msg)
+            self.signals.status_updated.emit(error_msg)
             app_logger.error(error_msg)
             self.result = {'success': 0, 'failed': 0, 'errors': [error_msg]}
-            self.process_completed.emit(self.result)
+            self.signals.process_completed.emit(self.result)
             
         except Exception as e:
             error_msg = f"批量处理失败: {str(e)}"
-            self.status_updated.emit(error_msg)
+            self.signals.status_updated.emit(error_msg)
             app_logger.error(f"批量处理异常: {type(e).__name__}: {str(e)}")
-            import traceback
-            app_logger.error(f"异常堆栈: {traceback.format_exc()}")
+            if app_logger.isEnabledFor(logging.DEBUG):
+                app_logger.debug(f"异常堆栈: {traceback.format_exc()}")
             self.result = {'success': 0, 'failed': 0, 'errors': [error_msg]}
-            self.process_completed.emit(self.result)
+            self.signals.process_completed.emit(self.result)
 
 
 class BatchTab(QWidget):
@@ -133,6 +146,8 @@ class BatchTab(QWidget):
     
     # 定义信号
     status_updated = pyqtSignal(str)
+    batch_started = pyqtSignal()  # 批量处理开始
+    batch_finished = pyqtSignal()  # 批量处理结束
     
     def __init__(self):
         """初始化批量生成选项卡"""
@@ -141,8 +156,9 @@ class BatchTab(QWidget):
         # 初始化批量处理器
         self.batch_processor = BatchProcessor()
         
-        # 当前处理线程
-        self.process_thread = None
+        # 当前批量处理任务的信号对象和取消事件，处理结束后置为None
+        self.process_signals = None
+        self.process_cancel_event = None
         
         # 初始化UI
         self.init_ui()
@@ -171,6 +187,21 @@ class BatchTab(QWidget):
         # 创建进度和结果区域
         progress_result_widget = self.create_progress_result_widget()
         main_layout.addWidget(progress_result_widget)
+        
+        # 条形码和二维码两组控件，供通用处理方法按角色查找
+        self._roles = {
+            role: SimpleNamespace(
+                file_radio=getattr(self, f"{role}_file_radio"),
+                file_path_input=getattr(self, f"{role}_file_path_input"),
+                browse_btn=getattr(self, f"{role}_browse_btn"),
+                data_column_combo=getattr(self, f"{role}_data_column_combo"),
+                data_list_input=getattr(self, f"{role}_data_list_input"),
+                file_prefix_input=getattr(self, f"{role}_file_prefix_input"),
+                file_format_combo=getattr(self, f"{role}_file_format_combo"),
+                output_dir_input=getattr(self, f"{role}_output_dir_input"),
+            )
+            for role in ('barcode', 'qrcode')
+        }
     
     def create_barcode_batch_tab(self):
         """创建条形码批量生成选项卡"""
@@ -199,7 +230,7 @@ class BatchTab(QWidget):
         self.barcode_file_path_input = QLineEdit()
         self.barcode_file_path_input.setPlaceholderText("选择包含数据的文件")
         self.barcode_browse_btn = QPushButton("浏览")
-        self.barcode_browse_btn.clicked.connect(self.browse_barcode_data_file)
+        self.barcode_browse_btn.clicked.connect(partial(self.browse_data_file, 'barcode'))
         
         file_path_layout = QHBoxLayout()
         file_path_layout.addWidget(self.barcode_file_path_input)
@@ -242,7 +273,7 @@ class BatchTab(QWidget):
         self.barcode_output_dir_input = QLineEdit()
         self.barcode_output_dir_input.setText(os.path.join(os.getcwd(), "output"))
         self.barcode_output_browse_btn = QPushButton("浏览")
-        self.barcode_output_browse_btn.clicked.connect(self.browse_barcode_output_dir)
+        self.barcode_output_browse_btn.clicked.connect(partial(self.browse_output_dir, 'barcode'))
         
         output_dir_layout = QHBoxLayout()
         output_dir_layout.addWidget(self.barcode_output_dir_input)
@@ -255,18 +286,18 @@ class BatchTab(QWidget):
         barcode_button_layout = QHBoxLayout()
         
         self.barcode_preview_btn = QPushButton("预览数据")
-        self.barcode_preview_btn.clicked.connect(self.preview_barcode_data)
+        self.barcode_preview_btn.clicked.connect(partial(self.preview_data, 'barcode'))
         barcode_button_layout.addWidget(self.barcode_preview_btn)
         
         self.barcode_generate_btn = QPushButton("批量生成")
-        self.barcode_generate_btn.clicked.connect(self.batch_generate_barcodes)
+        self.barcode_generate_btn.clicked.connect(partial(self.batch_generate, 'barcode'))
         barcode_button_layout.addWidget(self.barcode_generate_btn)
         
         layout.addLayout(barcode_button_layout)
         
         # 连接信号
-        self.barcode_file_radio.toggled.connect(self.on_barcode_data_type_changed)
-        self.barcode_file_path_input.textChanged.connect(self.on_barcode_file_path_changed)
+        self.barcode_file_radio.toggled.connect(partial(self.on_data_type_changed, 'barcode'))
+        self.barcode_file_path_input.textChanged.connect(partial(self.on_file_path_changed, 'barcode'))
         
         return widget
     
@@ -297,7 +328,7 @@ class BatchTab(QWidget):
         self.qrcode_file_path_input = QLineEdit()
         self.qrcode_file_path_input.setPlaceholderText("选择包含数据的文件")
         self.qrcode_browse_btn = QPushButton("浏览")
-        self.qrcode_browse_btn.clicked.connect(self.browse_qrcode_data_file)
+        self.qrcode_browse_btn.clicked.connect(partial(self.browse_data_file, 'qrcode'))
         
         file_path_layout = QHBoxLayout()
         file_path_layout.addWidget(self.qrcode_file_path_input)
@@ -334,7 +365,7 @@ class BatchTab(QWidget):
         self.qrcode_output_dir_input = QLineEdit()
         self.qrcode_output_dir_input.setText(os.path.join(os.getcwd(), "output"))
         self.qrcode_output_browse_btn = QPushButton("浏览")
-        self.qrcode_output_browse_btn.clicked.connect(self.browse_qrcode_output_dir)
+        self.qrcode_output_browse_btn.clicked.connect(partial(self.browse_output_dir, 'qrcode'))
         
         output_dir_layout = QHBoxLayout()
         output_dir_layout.addWidget(self.qrcode_output_dir_input)
@@ -347,18 +378,18 @@ class BatchTab(QWidget):
         qrcode_button_layout = QHBoxLayout()
         
         self.qrcode_preview_btn = QPushButton("预览数据")
-        self.qrcode_preview_btn.clicked.connect(self.preview_qrcode_data)
+        self.qrcode_preview_btn.clicked.connect(partial(self.preview_data, 'qrcode'))
         qrcode_button_layout.addWidget(self.qrcode_preview_btn)
         
         self.qrcode_generate_btn = QPushButton("批量生成")
-        self.qrcode_generate_btn.clicked.connect(self.batch_generate_qrcodes)
+        self.qrcode_generate_btn.clicked.connect(partial(self.batch_generate, 'qrcode'))
         qrcode_button_layout.addWidget(self.qrcode_generate_btn)
         
         layout.addLayout(qrcode_button_layout)
         
         # 连接信号
-        self.qrcode_file_radio.toggled.connect(self.on_qrcode_data_type_changed)
-        self.qrcode_file_path_input.textChanged.connect(self.on_qrcode_file_path_changed)
+        self.qrcode_file_radio.toggled.connect(partial(self.on_data_type_changed, 'qrcode'))
+        self.qrcode_file_path_input.textChanged.connect(partial(self.on_file_path_changed, 'qrcode'))
         
         return widget
     
@@ -389,27 +420,20 @@ class BatchTab(QWidget):
         
         return widget
     
-    def on_barcode_data_type_changed(self, checked):
-        """条形码数据源类型改变"""
-        is_file = self.barcode_file_radio.isChecked()
-        
-        self.barcode_file_path_input.setEnabled(is_file)
-        self.barcode_browse_btn.setEnabled(is_file)
-        self.barcode_data_column_combo.setEnabled(is_file)
-        self.barcode_data_list_input.setEnabled(not is_file)
-    
-    def on_qrcode_data_type_changed(self, checked):
-        """二维码数据源类型改变"""
-        is_file = self.qrcode_file_radio.isChecked()
-        
-        self.qrcode_file_path_input.setEnabled(is_file)
-        self.qrcode_browse_btn.setEnabled(is_file)
-        self.qrcode_data_column_combo.setEnabled(is_file)
-        self.qrcode_data_list_input.setEnabled(not is_file)
+    def on_data_type_changed(self, role, checked):
+        """数据源类型改变"""
+        widgets = self._roles[role]
+        is_file = widgets.file_radio.isChecked()
+        
+        widgets.file_path_input.setEnabled(is_file)
+        widgets.browse_btn.setEnabled(is_file)
+        widgets.data_column_combo.setEnabled(is_file)
+        widgets.data_list_input.setEnabled(not is_file)
     
-    def on_barcode_file_path_changed(self):
-        """条形码文件路径改变"""
-        file_path = self.barcode_file_path_input.text().strip()
+    def on_file_path_changed(self, role, text=None):
+        """数据文件路径改变"""
+        widgets = self._roles[role]
+        file_path = widgets.file_path_input.text().strip()
         if not file_path:
             return
         
@@ -417,46 +441,19 @@ class BatchTab(QWidget):
         success, columns, error_msg = self.batch_processor.get_csv_columns(file_path)
         
         if success:
-            # 更新列名下拉框
-            self.barcode_data_column_combo.clear()
-            self.barcode_data_column_combo.addItems(columns)
-            self.barcode_data_column_combo.setEnabled(True)
+            # 一次性替换列名下拉框的模型，避免逐项添加时反复发出信号
+            combo = widgets.data_column_combo
+            combo.blockSignals(True)
+            combo.setModel(QStringListModel(columns, combo))
+            combo.setCurrentIndex(0)
+            combo.blockSignals(False)
+            combo.setEnabled(True)
         else:
-            self.barcode_data_column_combo.clear()
-            self.barcode_data_column_combo.setEnabled(False)
-    
-    def on_qrcode_file_path_changed(self):
-        """二维码文件路径改变"""
-        file_path = self.qrcode_file_path_input.text().strip()
-        if not file_path:
-            return
-        
-        # 获取CSV文件的列名
-        success, columns, error_msg = self.batch_processor.get_csv_columns(file_path)
-        
-        if success:
-            # 更新列名下拉框
-            self.qrcode_data_column_combo.clear()
-            self.qrcode_data_column_combo.addItems(columns)
-            self.qrcode_data_column_combo.setEnabled(True)
-        else:
-            self.qrcode_data_column_combo.clear()
-            self.qrcode_data_column_combo.setEnabled(False)
-    
-    def browse_barcode_data_file(self):
-        """浏览条形码数据文件"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "选择数据文件",
-            os.getcwd(),
-            "所有支持的文件 (*.csv *.txt *.json);;CSV文件 (*.csv);;文本文件 (*.txt);;JSON文件 (*.json);;所有文件 (*)"
-        )
-        
-        if file_path:
-            self.barcode_file_path_input.setText(file_path)
+            widgets.data_column_combo.clear()
+            widgets.data_column_combo.setEnabled(False)
     
-    def browse_qrcode_data_file(self):
-        """浏览二维码数据文件"""
+    def browse_data_file(self, role, checked=False):
+        """浏览数据文件"""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "选择数据文件",
@@ -465,69 +462,31 @@ class BatchTab(QWidget):
         )
         
         if file_path:
-            self.qrcode_file_path_input.setText(file_path)
-    
-    def browse_barcode_output_dir(self):
-        """浏览条形码输出目录"""
-        dir_path = QFileDialog.getExistingDirectory(
-            self,
-            "选择输出目录",
-            self.barcode_output_dir_input.text()
-        )
-        
-        if dir_path:
-            self.barcode_output_dir_input.setText(dir_path)
+            self._roles[role].file_path_input.setText(file_path)
     
-    def browse_qrcode_output_dir(self):
-        """浏览二维码输出目录"""
+    def browse_output_dir(self, role, checked=False):
+        """浏览输出目录"""
+        output_dir_input = self._roles[role].output_dir_input
         dir_path = QFileDialog.getExistingDirectory(
             self,
             "选择输出目录",
-            self.qrcode_output_dir_input.text()
+            output_dir_input.text()
         )
         
         if dir_path:
-            self.qrcode_output_dir_input.setText(dir_path)
-    
-    def preview_barcode_data(self):
-        """预览条形码数据"""
-        data_source = self.get_barcode_data_source()
-        if not data_source:
-            self.status_updated.emit("请指定数据源")
-            return
-        
-        # 读取数据
-        if isinstance(data_source, str):  # 文件路径
-            success, data_list, error_msg = self.batch_processor.read_data_from_file(data_source)
-        else:  # 数据列表
-            data_list = data_source
-            success = True
-        
-        if success:
-            # 显示预览
-            preview_text = f"共 {len(data_list)} 条数据:\n\n"
-            preview_text += "\n".join(data_list[:10])  # 只显示前10条
-            if len(data_list) > 10:
-                preview_text += f"\n\n... 还有 {len(data_list) - 10} 条数据"
-            
-            self.result_text.setText(preview_text)
-            self.result_text.setVisible(True)
-            self.result_table.setVisible(False)
-            
-            self.status_updated.emit(f"数据预览: 共 {len(data_list)} 条")
-        else:
-            self.status_updated.emit(f"读取数据失败: {error_msg}")
+            output_dir_input.setText(dir_path)
     
-    def preview_qrcode_data(self):
-        """预览二维码数据"""
-        data_source = self.get_qrcode_data_source()
+    def preview_data(self, role, checked=False):
+        """预览数据"""
+        data_source = self.get_data_source(role)
         if not data_source:
             self.status_updated.emit("请指定数据源")
             return
         
         # 读取数据
-        if isinstance(data_source, str):  # 文件路径
-            success, data_list, error_msg = self.batch_processor.read_data_from_file(data_source)
+        if isinstance(data_source, tuple):  # 文件路径
+            file_path, data_column = data_source
+            success, data_list, error_msg = self.batch_processor.read_data_from_file(file_path, data_column)
         else:  # 数据列表
             data_list = data_source
             success = True
@@ -547,103 +506,56 @@ class BatchTab(QWidget):
         else:
             self.status_updated.emit(f"读取数据失败: {error_msg}")
     
-    def get_barcode_data_source(self):
-        """获取条形码数据源"""
-        if self.barcode_file_radio.isChecked():
-            file_path = self.barcode_file_path_input.text().strip()
-            if not file_path:
-                return None
-            
-            data_column = None
-            if self.barcode_data_column_combo.count() > 0:
-                data_column = self.barcode_data_column_combo.currentText()
-            
-            return (file_path, data_column)
-        else:
-            data_text = self.barcode_data_list_input.toPlainText().strip()
-            if not data_text:
-                return None
-            
-            return [line.strip() for line in data_text.split('\n') if line.strip()]
-    
-    def get_qrcode_data_source(self):
-        """获取二维码数据源"""
-        if self.qrcode_file_radio.isChecked():
-            file_path = self.qrcode_file_path_input.text().strip()
+    def get_data_source(self, role):
+        """获取数据源"""
+        widgets = self._roles[role]
+        if widgets.file_radio.isChecked():
+            file_path = widgets.file_path_input.text().strip()
             if not file_path:
                 return None
             
             data_column = None
-            if self.qrcode_data_column_combo.count() > 0:
-                data_column = self.qrcode_data_column_combo.currentText()
+            if widgets.data_column_combo.count() > 0:
+                data_column = widgets.data_column_combo.currentText()
             
             return (file_path, data_column)
         else:
-            data_text = self.qrcode_data_list_input.toPlainText().strip()
+            data_text = widgets.data_list_input.toPlainText().strip()
             if not data_text:
                 return None
             
             return [line.strip() for line in data_text.split('\n') if line.strip()]
     
-    def batch_generate_barcodes(self):
-        """批量生成条形码"""
-        # 获取数据源
-        data_source = self.get_barcode_data_source()
-        if not data_source:
-            self.status_updated.emit("请指定数据源")
-            return
-        
-        # 获取参数
-        barcode_type = self.barcode_type_combo.currentData()
-        output_dir = self.barcode_output_dir_input.text().strip()
-        file_prefix = self.barcode_file_prefix_input.text().strip()
-        file_format = self.barcode_file_format_combo.currentText()
-        
-        # 处理数据源
-        if isinstance(data_source, tuple):  # 文件路径
-            file_path, data_column = data_source
-            # 启动批量处理线程
-            self.start_batch_process('barcode', file_path, output_dir,
-                                   barcode_type=barcode_type,
-                                   file_prefix=file_prefix,
-                                   file_format=file_format,
-                                   data_column=data_column)
-        else:  # 数据列表
-            # 启动批量处理线程
-            self.start_batch_process('barcode', data_source, output_dir,
-                                   barcode_type=barcode_type,
-                                   file_prefix=file_prefix,
-                                   file_format=file_format)
-    
-    def batch_generate_qrcodes(self):
-        """批量生成二维码"""
+    def batch_generate(self, role, checked=False):
+        """批量生成条形码或二维码"""
         # 获取数据源
-        data_source = self.get_qrcode_data_source()
+        data_source = self.get_data_source(role)
         if not data_source:
             self.status_updated.emit("请指定数据源")
             return
         
         # 获取参数
-        output_dir = self.qrcode_output_dir_input.text().strip()
-        file_prefix = self.qrcode_file_prefix_input.text().strip()
-        file_format = self.qrcode_file_format_combo.currentText()
+        widgets = self._roles[role]
+        output_dir = widgets.output_dir_input.text().strip()
+        kwargs = {
+            'file_prefix': widgets.file_prefix_input.text().strip(),
+            'file_format': widgets.file_format_combo.currentText(),
+        }
+        if role == 'barcode':
+            kwargs['barcode_type'] = self.barcode_type_combo.currentData()
         
         # 处理数据源
         if isinstance(data_source, tuple):  # 文件路径
             file_path, data_column = data_source
-            # 启动批量处理线程
-            self.start_batch_process('qrcode', file_path, output_dir,
-                                   file_prefix=file_prefix,
-                                   file_format=file_format,
-                                   data_column=data_column)
+            # 启动批量处理任务
+            self.start_batch_process(role, file_path, output_dir,
+                                     data_column=data_column, **kwargs)
         else:  # 数据列表
-            # 启动批量处理线程
-            self.start_batch_process('qrcode', data_source, output_dir,
-                                   file_prefix=file_prefix,
-                                   file_format=file_format)
+            # 启动批量处理任务
+            self.start_batch_process(role, data_source, output_dir, **kwargs)
     
     def start_batch_process(self, process_type, data_source, output_dir, **kwargs):
-        """启动批量处理线程"""
+        """启动批量处理任务"""
         try:
             # 验证输入参数
             if not process_type:
@@ -655,13 +567,10 @@ class BatchTab(QWidget):
             if not output_dir:
                 raise ValueError("输出目录不能为空")
             
-            # 如果已有线程在运行，先停止
-            if self.process_thread and self.process_thread.isRunning():
-                app_logger.info("停止正在运行的批量处理线程")
-                self.process_thread.terminate()
-                self.process_thread.wait(3000)  # 等待最多3秒
-                if self.process_thread.isRunning():
-                    app_logger.warning("批量处理线程未能正常停止")
+            # 线程池中的任务无法强制终止，已有任务在运行时不启动新任务
+            if self.process_signals is not None:
+                self.status_updated.emit("批量处理正在进行，请等待完成")
+                return
             
             # 验证输出目录
             if not os.path.exists(output_dir):
@@ -684,21 +593,24 @@ class BatchTab(QWidget):
             self.result_text.setVisible(False)
             self.result_table.setVisible(False)
             
-            # 创建并启动线程
-            self.process_thread = BatchProcessThread(
+            # 创建任务并提交到线程池
+            worker = BatchProcessWorker(
                 self.batch_processor, process_type, data_source, output_dir, **kwargs
             )
+            self.process_signals = worker.signals
+            self.process_cancel_event = worker.cancel_event
             
-            # 连接信号
-            self.process_thread.progress_updated.connect(self.update_progress)
-            self.process_thread.process_completed.connect(self.on_process_completed)
-            self.process_thread.status_updated.connect(self.status_updated.emit)
+            # 连接信号（跨线程发射时自动排队到界面线程）
+            self.process_signals.progress_updated.connect(self.update_progress)
+            self.process_signals.process_completed.connect(self.on_process_completed)
+            self.process_signals.status_updated.connect(self.status_updated)
             
-            # 启动线程
-            self.process_thread.start()
+            # 启动任务
+            QThreadPool.globalInstance().start(worker)
+            self.batch_started.emit()
             
             self.status_updated.emit("开始批量生成...")
-            app_logger.info(f"批量处理线程已启动: 类型={process_type}, 数据源={data_source}, 输出目录={output_dir}")
+            app_logger.info(f"批量处理任务已启动: 类型={process_type}, 数据源={data_source}, 输出目录={output_dir}")
             
         except ValueError as ve:
             error_msg = f"参数错误: {str(ve)}"
@@ -719,8 +631,14 @@ class BatchTab(QWidget):
             error_msg = f"启动批量处理失败: {str(e)}"
             self.status_updated.emit(error_msg)
             app_logger.error(error_msg)
-            import traceback
-            app_logger.error(f"异常堆栈: {traceback.format_exc()}")
+            if app_logger.isEnabledFor(logging.DEBUG):
+                app_logger.debug(f"异常堆栈: {traceback.format_exc()}")
+    
+    def cancel_batch(self):
+        """取消正在进行的批量处理，当前条目处理完成后停止"""
+        if self.process_cancel_event is not None:
+            self.process_cancel_event.set()
+            app_logger.info("已请求取消批量处理")
     
     @pyqtSlot(int, int)
     def update_progress(self, current, total):
@@ -732,6 +650,10 @@ class BatchTab(QWidget):
     @pyqtSlot(dict)
     def on_process_completed(self, result):
         """处理完成"""
+        self.process_signals = None
+        self.process_cancel_event = None
+        self.batch_finished.emit()
+        
         try:
             # 隐藏进度条
             self.progress_bar.setVisible(False)
@@ -773,8 +695,8 @@ class BatchTab(QWidget):
         except Exception as e:
             error_msg = f"处理完成时发生错误: {str(e)}"
             app_logger.error(error_msg)
-            import traceback
-            app_logger.error(f"异常堆栈: {traceback.format_exc()}")
+            if app_logger.isEnabledFor(logging.DEBUG):
+                app_logger.debug(f"异常堆栈: {traceback.format_exc()}")
             self.status_updated.emit(error_msg)
     
     def display_result(self, result):
@@ -5,21 +5,54 @@
 
 import sys
 import os
+import logging
+import importlib
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QTabWidget, QMenuBar, QStatusBar, 
+                            QHBoxLayout, QStackedWidget, QToolBar, QActionGroup,
+                            QMenuBar, QStatusBar, 
                             QAction, QMessageBox, QFileDialog, QLabel, 
-                            QPushButton, QFrame)
-from PyQt5.QtCore import Qt, QSize
+                            QPushButton, QGridLayout, QSizePolicy)
+from PyQt5.QtCore import Qt, QSize, QTimer
 from PyQt5.QtGui import QIcon, QFont
-from ui.barcode_tab import BarcodeTab
-from ui.qrcode_tab import QRCodeTab
-from ui.batch_tab import BatchTab
 from utils.logger import app_logger
 
 
+# 关于对话框内容
+_ABOUT_HTML = """
+<h2>条形码和二维码生成器</h2>
+<p>版本: 1.0.0</p>
+<p>一个基于Python的Windows客户端应用程序，用于生成各种类型的条形码和二维码。</p>
+<p>支持的功能:</p>
+<ul>
+    <li>多种条形码编码格式</li>
+    <li>二维码生成</li>
+    <li>批量生成功能</li>
+    <li>自定义样式和尺寸</li>
+</ul>
+<p>Copyright © 2023</p>
+"""
+
+
+# 标题字体，需在QApplication创建后才能构造，首次使用时创建
+_title_font = None
+
+
+def _get_title_font():
+    """获取标题字体"""
+    global _title_font
+    if _title_font is None:
+        _title_font = QFont()
+        _title_font.setPointSize(18)
+        _title_font.setBold(True)
+    return _title_font
+
+
 class MainWindow(QMainWindow):
     """主窗口类"""
     
+    # 选项卡名称
+    _TAB_NAMES = ("条形码", "二维码", "批量生成")
+    
     def __init__(self):
         """初始化主窗口"""
         super().__init__()
@@ -29,54 +62,92 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(800, 600)
         self.resize(1000, 700)
         
+        # 是否有批量处理正在进行
+        self._batch_running = False
+        
+        # 调试模式下检查是否有代码在应用程序级别安装事件过滤器
+        if app_logger.isEnabledFor(logging.DEBUG):
+            self._guard_app_event_filter()
+        
         # 初始化UI
         try:
             self.init_ui()
-            app_logger.info("主窗口初始化成功")
-        except Exception as e:
+            app_logger.debug("主窗口初始化成功")
+        except (ImportError, RuntimeError) as e:
             app_logger.error(f"主窗口初始化失败: {str(e)}")
             QMessageBox.critical(self, "初始化错误", f"主窗口初始化失败: {str(e)}")
     
+    def _guard_app_event_filter(self):
+        """
+        在QApplication上安装事件过滤器时记录警告
+        
+        应用程序级别的事件过滤器会让每个Qt事件都经过Python代码，
+        需要处理按键等事件时应重写具体控件的事件处理函数。
+        """
+        app = QApplication.instance()
+        if app is None:
+            return
+        
+        install_event_filter = app.installEventFilter
+        
+        def guarded_install_event_filter(event_filter):
+            app_logger.warning(f"不应在QApplication上安装事件过滤器: {type(event_filter).__name__}")
+            install_event_filter(event_filter)
+        
+        app.installEventFilter = guarded_install_event_filter
+    
     def init_ui(self):
         """初始化用户界面"""
         # 创建中央部件
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
-        # 创建主布局
-        main_layout = QVBoxLayout(central_widget)
+        # 创建主布局（单个网格布局，只有页面所在行可拉伸）
+        main_layout = QGridLayout(central_widget)
         main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setRowStretch(2, 1)
         
         # 创建标题标签
         title_label = QLabel("条形码和二维码生成器")
         title_label.setAlignment(Qt.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        main_layout.addWidget(title_label)
-        
-        # 创建分隔线
-        line = QFrame()
-        line.setFrameShape(QFrame.HLine)
-        line.setFrameShadow(QFrame.Sunken)
-        main_layout.addWidget(line)
-        
-        # 创建选项卡部件
-        self.tab_widget = QTabWidget()
-        self.tab_widget.setTabPosition(QTabWidget.North)
-        
-        # 创建各个选项卡
-        self.barcode_tab = BarcodeTab()
-        self.qrcode_tab = QRCodeTab()
-        self.batch_tab = BatchTab()
-        
-        # 添加选项卡
-        self.tab_widget.addTab(self.barcode_tab, "条形码")
-        self.tab_widget.addTab(self.qrcode_tab, "二维码")
-        self.tab_widget.addTab(self.batch_tab, "批量生成")
-        
-        main_layout.addWidget(self.tab_widget)
+        # 用下边框代替单独的分隔线控件
+        title_label.setStyleSheet("border-bottom: 1px solid palette(mid); padding-bottom: 4px;")
+        title_label.setFont(_get_title_font())
+        title_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        main_layout.addWidget(title_label, 0, 0)
+        
+        # 创建选项卡工具栏和页面堆栈
+        self.tab_bar = QToolBar()
+        self.tab_bar.setToolButtonStyle(Qt.ToolButtonTextOnly)
+        self.tab_action_group = QActionGroup(self)
+        self.tab_action_group.setExclusive(True)
+        
+        self.stack = QStackedWidget()
+        self.stack.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        
+        # 各选项卡在首次切换到时才导入模块并创建，先添加空的占位页面
+        self._tab_factories = {
+            0: ('ui.barcode_tab', 'BarcodeTab'),
+            1: ('ui.qrcode_tab', 'QRCodeTab'),
+            2: ('ui.batch_tab', 'BatchTab'),
+        }
+        self._tabs_built = {}
+        for index, tab_name in enumerate(self._TAB_NAMES):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self.stack.addWidget(placeholder)
+            
+            tab_action = QAction(tab_name, self)
+            tab_action.setCheckable(True)
+            tab_action.setData(index)
+            self.tab_action_group.addAction(tab_action)
+            self.tab_bar.addAction(tab_action)
+        
+        self.tab_action_group.actions()[0].setChecked(True)
+        
+        main_layout.addWidget(self.tab_bar, 1, 0)
+        main_layout.addWidget(self.stack, 2, 0)
         
         # 创建菜单栏
         self.create_menu_bar()
@@ -84,8 +155,30 @@ class MainWindow(QMainWindow):
         # 创建状态栏
         self.create_status_bar()
         
+        # 创建对话框
+        self.create_message_boxes()
+        
         # 连接信号和槽
         self.connect_signals()
+        
+        # 创建默认显示的选项卡
+        self.build_tab(self.stack.currentIndex())
+    
+    def create_message_boxes(self):
+        """创建关于对话框和退出确认对话框，显示时重复使用"""
+        self._about_box = QMessageBox(self)
+        self._about_box.setWindowTitle("关于")
+        self._about_box.setTextFormat(Qt.RichText)
+        self._about_box.setText(_ABOUT_HTML)
+        self._about_box.setStandardButtons(QMessageBox.Ok)
+        
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setIcon(QMessageBox.Question)
+        self._confirm_box.setWindowTitle("确认退出")
+        self._confirm_box.setText("批量生成仍在进行，确定要退出应用程序吗？")
+        self._confirm_box.setInformativeText("退出前会等待当前条目生成完成，剩余数据将不再处理。")
+        self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        self._confirm_box.setDefaultButton(QMessageBox.No)
     
     def create_menu_bar(self):
         """创建菜单栏"""
@@ -114,59 +207,93 @@ class MainWindow(QMainWindow):
         """创建状态栏"""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("就绪")
+        
+        # 使用常驻标签显示状态，setText异步重绘，不像showMessage那样立即刷新
+        self.status_label = QLabel("就绪")
+        self.status_bar.addWidget(self.status_label, 1)
+        
+        # 合并同一轮事件循环内的多次状态更新，只显示最后一条
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(0)
+        self._status_timer.timeout.connect(self._flush_status)
     
     def connect_signals(self):
         """连接信号和槽"""
-        # 选项卡切换时更新状态栏
-        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+        # 选项卡切换时创建页面并更新状态栏
+        self.tab_action_group.triggered.connect(self.on_tab_action_triggered)
+        self.stack.currentChanged.connect(self.on_tab_changed)
+    
+    def build_tab(self, index):
+        """首次切换到选项卡时创建页面"""
+        if index in self._tabs_built or index not in self._tab_factories:
+            return
+        
+        module_name, class_name = self._tab_factories[index]
+        tab_class = getattr(importlib.import_module(module_name), class_name)
+        tab = tab_class()
+        self.stack.widget(index).layout().addWidget(tab)
+        
+        # 连接选项卡的状态更新信号
+        tab.status_updated.connect(self.update_status)
         
-        # 连接各选项卡的状态更新信号
-        self.barcode_tab.status_updated.connect(self.update_status)
-        self.qrcode_tab.status_updated.connect(self.update_status)
-        self.batch_tab.status_updated.connect(self.update_status)
+        # 跟踪批量处理状态，用于退出确认
+        if hasattr(tab, 'batch_started'):
+            tab.batch_started.connect(self.on_batch_started)
+            tab.batch_finished.connect(self.on_batch_finished)
+        self._tabs_built[index] = tab
+    
+    def on_tab_action_triggered(self, action):
+        """点击选项卡按钮时切换页面"""
+        self.stack.setCurrentIndex(action.data())
     
     def on_tab_changed(self, index):
         """选项卡切换时的处理"""
-        tab_names = ["条形码", "二维码", "批量生成"]
-        if 0 <= index < len(tab_names):
-            self.status_bar.showMessage(f"当前选项卡: {tab_names[index]}")
+        self.build_tab(index)
+        
+        if 0 <= index < len(self._TAB_NAMES):
+            self.update_status(f"当前选项卡: {self._TAB_NAMES[index]}")
     
     def update_status(self, message):
         """更新状态栏消息"""
-        self.status_bar.showMessage(message)
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        """将最新的状态消息写入状态栏"""
+        if self._pending_status is not None:
+            self.status_label.setText(self._pending_status)
+            self._pending_status = None
+    
+    def on_batch_started(self):
+        """批量处理开始"""
+        self._batch_running = True
+    
+    def on_batch_finished(self):
+        """批量处理结束"""
+        self._batch_running = False
     
     def show_about_dialog(self):
         """显示关于对话框"""
-        try:
-            about_text = """
-            <h2>条形码和二维码生成器</h2>
-            <p>版本: 1.0.0</p>
-            <p>一个基于Python的Windows客户端应用程序，用于生成各种类型的条形码和二维码。</p>
-            <p>支持的功能:</p>
-            <ul>
-                <li>多种条形码编码格式</li>
-                <li>二维码生成</li>
-                <li>批量生成功能</li>
-                <li>自定义样式和尺寸</li>
-            </ul>
-            <p>Copyright © 2023</p>
-            """
-            QMessageBox.about(self, "关于", about_text)
-            app_logger.info("显示关于对话框")
-        except Exception as e:
-            app_logger.error(f"显示关于对话框失败: {str(e)}")
+        self._about_box.exec_()
     
     def closeEvent(self, event):
         """窗口关闭事件"""
-        reply = QMessageBox.question(
-            self, '确认退出', 
-            '确定要退出应用程序吗？',
-            QMessageBox.Yes | QMessageBox.No, 
-            QMessageBox.No
-        )
+        # 没有正在进行的批量处理时直接退出
+        if not self._batch_running:
+            app_logger.info("应用程序正常退出")
+            event.accept()
+            return
+        
+        reply = self._confirm_box.exec_()
         
         if reply == QMessageBox.Yes:
+            # 线程池退出时会等待任务结束，先通知批量任务停止处理剩余数据
+            for tab in self._tabs_built.values():
+                if hasattr(tab, 'cancel_batch'):
+                    tab.cancel_batch()
             app_logger.info("应用程序正常退出")
             event.accept()
         else:
@@ -175,14 +302,27 @@ class MainWindow(QMainWindow):
 
 def main():
     """主函数"""
+    # 设置高DPI支持，并合并高频的鼠标移动和数位板事件
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+    QApplication.setAttribute(Qt.AA_CompressTabletEvents)
+    
+    # 避免为子控件创建多余的原生窗口
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    
     app = QApplication(sys.argv)
     
-    # 设置应用程序样式
-    app.setStyle('Fusion')
+    # 设置应用程序样式（macOS使用原生样式，不加载Fusion样式插件）
+    if sys.platform == 'win32' or sys.platform.startswith('linux'):
+        app.setStyle('Fusion')
     
     # 创建主窗口
     window = MainWindow()
     window.show()
     
+    # 进入事件循环后先处理首批显示和绘制事件
+    QTimer.singleShot(0, app.processEvents)
+    
     # 运行应用程序
     sys.exit(app.exec_())
\ No newline at end of file
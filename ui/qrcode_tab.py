@@ -8,21 +8,147 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                             QLabel, QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox,
                             QPushButton, QCheckBox, QColorDialog, QFileDialog,
                             QGroupBox, QGridLayout, QTextEdit, QScrollArea,
-                            QFrame, QSizePolicy, QSlider)
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QPixmap, QFont, QColor
+                            QFrame, QSlider)
+from PyQt5.QtCore import (Qt, pyqtSignal, QSize, QRect, QObject, QRunnable,
+                          QThreadPool, pyqtSlot)
+from PyQt5.QtGui import QPixmap, QImage, QColor, QPainter
 from PIL import Image
 from core.qrcode_generator import QRCodeGenerator
 from utils.logger import app_logger
 from utils.file_handler import FileHandler
 
 
+def _pil_to_qimage(image):
+    """将PIL图像转换为QImage
+    
+    直接用原始RGB字节构造QImage，不经过PIL的ImageQt模块。
+    返回的QImage持有自己的数据副本，可以安全地跨线程传递。
+    
+    Args:
+        image: PIL图像对象
+        
+    Returns:
+        QImage: 转换后的图像
+    """
+    rgb = image.convert('RGB')
+    data = rgb.tobytes('raw', 'RGB')
+    width, height = rgb.size
+    return QImage(data, width, height, width * 3, QImage.Format_RGB888).copy()
+
+
+class QRPreviewLabel(QLabel):
+    """二维码预览标签，绘制时由QPainter直接缩放原始尺寸的图像"""
+    
+    def __init__(self, parent=None):
+        """初始化预览标签"""
+        super().__init__(parent)
+        self._source_pixmap = None
+        
+        # 上次计算的目标区域，区域大小不变时直接复用
+        self._last_target_size = None
+        self._target_rect = QRect()
+    
+    def set_source_pixmap(self, pixmap):
+        """设置要显示的原始尺寸图像
+        
+        Args:
+            pixmap: 原始尺寸的QPixmap
+        """
+        self._source_pixmap = pixmap
+        self._last_target_size = None
+        self.clear()
+        self.update()
+    
+    def paintEvent(self, event):
+        """绘制事件"""
+        super().paintEvent(event)
+        
+        if self._source_pixmap is None or self._source_pixmap.isNull():
+            return
+        
+        # 按比例计算居中的目标区域（大小未变时复用上次结果）
+        contents = self.contentsRect()
+        target_size = contents.size()
+        if target_size != self._last_target_size:
+            self._target_rect = QRect(contents.topLeft(),
+                                      self._source_pixmap.size().scaled(target_size, Qt.KeepAspectRatio))
+            self._target_rect.moveCenter(contents.center())
+            self._last_target_size = target_size
+        target_rect = self._target_rect
+        
+        # 二维码模块是纯色方块，使用最近邻缩放即可保持边缘清晰
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        painter.drawPixmap(target_rect, self._source_pixmap, self._source_pixmap.rect())
+        painter.end()
+
+
+class QRCodeGenerateSignals(QObject):
+    """二维码生成任务的信号（QRunnable不是QObject，信号需单独定义）"""
+    
+    qrcode_ready = pyqtSignal(object, QImage, str, dict)  # 生成的图像, 预览图像, 二维码数据, 生成选项
+    error_occurred = pyqtSignal(str)  # 错误消息
+
+
+class QRCodeGenerateWorker(QRunnable):
+    """二维码生成任务，在QThreadPool的工作线程中运行"""
+    
+    def __init__(self, generator, data, options):
+        """
+        初始化二维码生成任务
+        
+        Args:
+            generator: 二维码生成器实例
+            data: 二维码数据
+            options: 生成选项
+        """
+        super().__init__()
+        self.signals = QRCodeGenerateSignals()
+        self.generator = generator
+        self.data = data
+        self.options = options
+    
+    def run(self):
+        """运行二维码生成"""
+        try:
+            image = self.generator.generate_qrcode(self.data, self.options)
+            
+            # 在工作线程中完成到QImage的转换，界面线程只需转成QPixmap
+            q_image = _pil_to_qimage(image) if image else QImage()
+            self.signals.qrcode_ready.emit(image, q_image, self.data, self.options)
+        except ValueError as e:
+            error_msg = f"二维码数据验证失败: {str(e)}"
+            app_logger.error(error_msg)
+            self.signals.error_occurred.emit(error_msg)
+        except FileNotFoundError as e:
+            error_msg = f"找不到指定的Logo文件: {str(e)}"
+            app_logger.error(error_msg)
+            self.signals.error_occurred.emit(error_msg)
+        except PermissionError as e:
+            error_msg = f"文件权限错误: {str(e)}"
+            app_logger.error(error_msg)
+            self.signals.error_occurred.emit(error_msg)
+        except Exception as e:
+            error_msg = f"生成二维码时发生错误: {str(e)}"
+            app_logger.error(error_msg)
+            self.signals.error_occurred.emit(error_msg)
+
+
 class QRCodeTab(QWidget):
     """二维码生成选项卡"""
     
     # 定义信号
     status_updated = pyqtSignal(str)
     
+    # 纠错级别下拉框选项: (显示文本, 代码)
+    _ECC_COMBO_ITEMS = [
+        (f"{info['name']} - {info['description']}", code)
+        for code, info in QRCodeGenerator.ERROR_CORRECTION_LEVELS.items()
+    ]
+    
+    # 二维码信息显示模板
+    _INFO_TEMPLATE = "二维码数据: {data}\n版本: {version}\n纠错级别: {name} - {desc}"
+    
     def __init__(self):
         """初始化二维码选项卡"""
         super().__init__()
@@ -30,9 +156,33 @@ class QRCodeTab(QWidget):
         # 初始化二维码生成器
         self.qrcode_generator = QRCodeGenerator()
         
+        # 纠错级别信息缓存: 代码 -> (名称, 描述, 取值)
+        self._ecc_cache = {
+            code: (info['name'], info['description'], info['value'])
+            for code, info in QRCodeGenerator.ERROR_CORRECTION_LEVELS.items()
+        }
+        # 按取值查找纠错级别的名称和描述: 取值 -> (名称, 描述)
+        self._ecc_info_by_value = {
+            value: (name, description) for name, description, value in self._ecc_cache.values()
+        }
+        
         # 当前二维码图像
         self.current_qrcode_image = None
         
+        # 正在运行的生成任务的信号
+        self.generate_signals = None
+        
+        # 首次使用时创建并复用的对话框
+        self._color_dialog = None
+        self._logo_dialog = None
+        self._save_dialog = None
+        
+        # 原始尺寸的预览图，由预览标签在绘制时缩放，不再重复转换PIL图像
+        self._source_pixmap = None
+        
+        # 选项卡隐藏时推迟更新预览，显示时再刷新
+        self._needs_rescale = False
+        
         # 初始化UI
         self.init_ui()
         
@@ -77,10 +227,6 @@ class QRCodeTab(QWidget):
         # 设置滚动区域的内容
         scroll_area.setWidget(content_widget)
         main_layout.addWidget(scroll_area)
-        
-        # 初始化二维码生成器
-        from core.qrcode_generator import QRCodeGenerator
-        self.qrcode_generator = QRCodeGenerator()
     
     def create_basic_settings_group(self):
         """创建基本设置组"""
@@ -101,8 +247,8 @@ class QRCodeTab(QWidget):
         
         # 纠错级别选择
         self.error_correction_combo = QComboBox()
-        for code, info in QRCodeGenerator.ERROR_CORRECTION_LEVELS.items():
-            self.error_correction_combo.addItem(f"{info['name']} - {info['description']}", code)
+        for text, code in self._ECC_COMBO_ITEMS:
+            self.error_correction_combo.addItem(text, code)
         layout.addRow("纠错级别:", self.error_correction_combo)
         
         # 模块大小
@@ -129,6 +275,7 @@ class QRCodeTab(QWidget):
         self.foreground_color_btn.clicked.connect(self.choose_foreground_color)
         self.foreground_color_label = QLabel("黑色")
         self.foreground_color = QColor(0, 0, 0)
+        self.foreground_color_hex = "#000000"
         layout.addWidget(QLabel("前景色:"), 0, 0)
         layout.addWidget(self.foreground_color_btn, 0, 1)
         layout.addWidget(self.foreground_color_label, 0, 2)
@@ -138,6 +285,7 @@ class QRCodeTab(QWidget):
         self.background_color_btn.clicked.connect(self.choose_background_color)
         self.background_color_label = QLabel("白色")
         self.background_color = QColor(255, 255, 255)
+        self.background_color_hex = "#ffffff"
         layout.addWidget(QLabel("背景色:"), 1, 0)
         layout.addWidget(self.background_color_btn, 1, 1)
         layout.addWidget(self.background_color_label, 1, 2)
@@ -175,6 +323,9 @@ class QRCodeTab(QWidget):
         layout.addWidget(QLabel("Logo大小:"), 2, 0)
         layout.addWidget(self.logo_size_spin, 2, 1)
         
+        # 随复选框一起启用/禁用的控件
+        self._logo_widgets = [self.logo_path_input, self.browse_logo_btn, self.logo_size_spin]
+        
         return group
     
     def create_text_settings_group(self):
@@ -215,10 +366,15 @@ class QRCodeTab(QWidget):
         self.text_color_btn.setEnabled(False)
         self.text_color_label = QLabel("黑色")
         self.text_color = QColor(0, 0, 0)
+        self.text_color_hex = "#000000"
         layout.addWidget(QLabel("文本颜色:"), 4, 0)
         layout.addWidget(self.text_color_btn, 4, 1)
         layout.addWidget(self.text_color_label, 4, 2)
         
+        # 随复选框一起启用/禁用的控件
+        self._text_widgets = [self.text_input, self.text_position_combo,
+                              self.text_font_size_spin, self.text_color_btn]
+        
         return group
     
     def create_preview_action_group(self):
@@ -227,7 +383,7 @@ class QRCodeTab(QWidget):
         layout = QVBoxLayout(group)
         
         # 创建预览标签
-        self.preview_label = QLabel()
+        self.preview_label = QRPreviewLabel()
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setMinimumSize(300, 300)
         self.preview_label.setStyleSheet("border: 1px solid #ccc;")
@@ -256,265 +412,96 @@ class QRCodeTab(QWidget):
         layout.addLayout(button_layout)
         
         return group
-
-    def create_input_panel(self):
-        """创建输入面板"""
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        
-        # 基本设置组
-        basic_group = QGroupBox("基本设置")
-        basic_layout = QFormLayout(basic_group)
-        
-        # 二维码数据输入
-        self.data_input = QLineEdit()
-        self.data_input.setPlaceholderText("请输入二维码数据")
-        basic_layout.addRow("二维码数据:", self.data_input)
-        
-        # 版本选择
-        self.version_spin = QSpinBox()
-        self.version_spin.setRange(1, 40)
-        self.version_spin.setValue(1)
-        self.version_spin.setToolTip("控制二维码的大小，1是最小的，40是最大的")
-        basic_layout.addRow("版本:", self.version_spin)
-        
-        # 纠错级别选择
-        self.error_correction_combo = QComboBox()
-        for code, info in QRCodeGenerator.ERROR_CORRECTION_LEVELS.items():
-            self.error_correction_combo.addItem(f"{info['name']} - {info['description']}", code)
-        basic_layout.addRow("纠错级别:", self.error_correction_combo)
-        
-        # 模块大小
-        self.box_size_spin = QSpinBox()
-        self.box_size_spin.setRange(1, 50)
-        self.box_size_spin.setValue(10)
-        basic_layout.addRow("模块大小:", self.box_size_spin)
-        
-        # 边框大小
-        self.border_spin = QSpinBox()
-        self.border_spin.setRange(0, 20)
-        self.border_spin.setValue(4)
-        basic_layout.addRow("边框大小:", self.border_spin)
-        
-        layout.addWidget(basic_group)
-        
-        # 颜色设置组
-        color_group = QGroupBox("颜色设置")
-        color_layout = QGridLayout(color_group)
-        
-        # 前景色
-        self.foreground_color_btn = QPushButton("选择前景色")
-        self.foreground_color_btn.clicked.connect(self.choose_foreground_color)
-        self.foreground_color_label = QLabel("黑色")
-        self.foreground_color = QColor(0, 0, 0)
-        color_layout.addWidget(QLabel("前景色:"), 0, 0)
-        color_layout.addWidget(self.foreground_color_btn, 0, 1)
-        color_layout.addWidget(self.foreground_color_label, 0, 2)
-        
-        # 背景色
-        self.background_color_btn = QPushButton("选择背景色")
-        self.background_color_btn.clicked.connect(self.choose_background_color)
-        self.background_color_label = QLabel("白色")
-        self.background_color = QColor(255, 255, 255)
-        color_layout.addWidget(QLabel("背景色:"), 1, 0)
-        color_layout.addWidget(self.background_color_btn, 1, 1)
-        color_layout.addWidget(self.background_color_label, 1, 2)
-        
-        layout.addWidget(color_group)
-        
-        # Logo设置组
-        logo_group = QGroupBox("Logo设置")
-        logo_layout = QGridLayout(logo_group)
-        
-        # 添加Logo复选框
-        self.add_logo_checkbox = QCheckBox("添加Logo")
-        self.add_logo_checkbox.toggled.connect(self.on_add_logo_toggled)
-        logo_layout.addWidget(self.add_logo_checkbox, 0, 0, 1, 2)
-        
-        # Logo路径
-        self.logo_path_input = QLineEdit()
-        self.logo_path_input.setPlaceholderText("Logo文件路径")
-        self.logo_path_input.setEnabled(False)
-        logo_layout.addWidget(QLabel("Logo路径:"), 1, 0)
-        logo_layout.addWidget(self.logo_path_input, 1, 1)
-        
-        # 浏览按钮
-        self.browse_logo_btn = QPushButton("浏览")
-        self.browse_logo_btn.clicked.connect(self.browse_logo)
-        self.browse_logo_btn.setEnabled(False)
-        logo_layout.addWidget(self.browse_logo_btn, 1, 2)
-        
-        # Logo大小
-        self.logo_size_spin = QSpinBox()
-        self.logo_size_spin.setRange(10, 200)
-        self.logo_size_spin.setValue(100)
-        self.logo_size_spin.setEnabled(False)
-        logo_layout.addWidget(QLabel("Logo大小:"), 2, 0)
-        logo_layout.addWidget(self.logo_size_spin, 2, 1)
-        
-        layout.addWidget(logo_group)
-        
-        # 文本设置组
-        text_group = QGroupBox("文本设置")
-        text_layout = QGridLayout(text_group)
-        
-        # 添加文本复选框
-        self.add_text_checkbox = QCheckBox("添加文本")
-        self.add_text_checkbox.toggled.connect(self.on_add_text_toggled)
-        text_layout.addWidget(self.add_text_checkbox, 0, 0, 1, 2)
-        
-        # 文本内容
-        self.text_input = QLineEdit()
-        self.text_input.setPlaceholderText("要添加的文本")
-        self.text_input.setEnabled(False)
-        text_layout.addWidget(QLabel("文本内容:"), 1, 0)
-        text_layout.addWidget(self.text_input, 1, 1)
-        
-        # 文本位置
-        self.text_position_combo = QComboBox()
-        self.text_position_combo.addItems(["顶部", "底部"])
-        self.text_position_combo.setEnabled(False)
-        text_layout.addWidget(QLabel("文本位置:"), 2, 0)
-        text_layout.addWidget(self.text_position_combo, 2, 1)
-        
-        # 文本字体大小
-        self.text_font_size_spin = QSpinBox()
-        self.text_font_size_spin.setRange(8, 30)
-        self.text_font_size_spin.setValue(12)
-        self.text_font_size_spin.setEnabled(False)
-        text_layout.addWidget(QLabel("字体大小:"), 3, 0)
-        text_layout.addWidget(self.text_font_size_spin, 3, 1)
-        
-        # 文本颜色
-        self.text_color_btn = QPushButton("选择文本颜色")
-        self.text_color_btn.clicked.connect(self.choose_text_color)
-        self.text_color_btn.setEnabled(False)
-        self.text_color_label = QLabel("黑色")
-        self.text_color = QColor(0, 0, 0)
-        text_layout.addWidget(QLabel("文本颜色:"), 4, 0)
-        text_layout.addWidget(self.text_color_btn, 4, 1)
-        text_layout.addWidget(self.text_color_label, 4, 2)
-        
-        layout.addWidget(text_group)
-        
-        # 操作按钮
-        button_layout = QHBoxLayout()
-        
-        self.generate_btn = QPushButton("生成二维码")
-        self.generate_btn.clicked.connect(self.generate_qrcode)
-        button_layout.addWidget(self.generate_btn)
-        
-        self.save_btn = QPushButton("保存二维码")
-        self.save_btn.clicked.connect(self.save_qrcode)
-        self.save_btn.setEnabled(False)
-        button_layout.addWidget(self.save_btn)
-        
-        layout.addLayout(button_layout)
-        
-        # 添加弹性空间
-        layout.addStretch()
-        
-        return panel
-    
-    def create_preview_panel(self):
-        """创建预览面板"""
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        
-        # 预览标题
-        preview_label = QLabel("预览")
-        preview_label.setFont(QFont("", 12, QFont.Bold))
-        layout.addWidget(preview_label)
-        
-        # 创建滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        
-        # 创建预览标签
-        self.preview_label = QLabel()
-        self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setMinimumSize(300, 300)
-        self.preview_label.setStyleSheet("border: 1px solid #ccc;")
-        self.preview_label.setText("请输入数据并点击生成按钮")
-        
-        scroll_area.setWidget(self.preview_label)
-        layout.addWidget(scroll_area)
-        
-        # 二维码信息
-        self.info_text = QTextEdit()
-        self.info_text.setReadOnly(True)
-        self.info_text.setMaximumHeight(100)
-        layout.addWidget(QLabel("二维码信息:"))
-        layout.addWidget(self.info_text)
-        
-        return panel
     
     def on_add_logo_toggled(self, checked):
         """添加Logo复选框状态改变"""
-        self.logo_path_input.setEnabled(checked)
-        self.browse_logo_btn.setEnabled(checked)
-        self.logo_size_spin.setEnabled(checked)
+        for widget in self._logo_widgets:
+            widget.setEnabled(checked)
     
     def on_add_text_toggled(self, checked):
         """添加文本复选框状态改变"""
-        self.text_input.setEnabled(checked)
-        self.text_position_combo.setEnabled(checked)
-        self.text_font_size_spin.setEnabled(checked)
-        self.text_color_btn.setEnabled(checked)
+        for widget in self._text_widgets:
+            widget.setEnabled(checked)
+    
+    def _pick_color(self, initial, title):
+        """用复用的颜色对话框选择颜色
+        
+        Args:
+            initial: 初始颜色
+            title: 对话框标题
+            
+        Returns:
+            QColor: 选择的颜色，取消时返回无效颜色
+        """
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+        
+        self._color_dialog.setWindowTitle(title)
+        self._color_dialog.setCurrentColor(initial)
+        if self._color_dialog.exec_():
+            return self._color_dialog.selectedColor()
+        return QColor()
     
     def choose_foreground_color(self):
         """选择前景色"""
-        color = QColorDialog.getColor(self.foreground_color, self, "选择前景色")
+        color = self._pick_color(self.foreground_color, "选择前景色")
         if color.isValid():
             self.foreground_color = color
-            self.foreground_color_label.setText(color.name())
+            self.foreground_color_hex = color.name()
+            self.foreground_color_label.setText(self.foreground_color_hex)
     
     def choose_background_color(self):
         """选择背景色"""
-        color = QColorDialog.getColor(self.background_color, self, "选择背景色")
+        color = self._pick_color(self.background_color, "选择背景色")
         if color.isValid():
             self.background_color = color
-            self.background_color_label.setText(color.name())
+            self.background_color_hex = color.name()
+            self.background_color_label.setText(self.background_color_hex)
     
     def choose_text_color(self):
         """选择文本颜色"""
-        color = QColorDialog.getColor(self.text_color, self, "选择文本颜色")
+        color = self._pick_color(self.text_color, "选择文本颜色")
         if color.isValid():
             self.text_color = color
-            self.text_color_label.setText(color.name())
+            self.text_color_hex = color.name()
+            self.text_color_label.setText(self.text_color_hex)
     
     def browse_logo(self):
         """浏览Logo文件"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "选择Logo文件",
-            os.getcwd(),
-            "图像文件 (*.png *.jpg *.jpeg *.bmp *.gif);;所有文件 (*)"
-        )
+        if self._logo_dialog is None:
+            self._logo_dialog = QFileDialog(
+                self,
+                "选择Logo文件",
+                os.getcwd(),
+                "图像文件 (*.png *.jpg *.jpeg *.bmp *.gif);;所有文件 (*)"
+            )
+            self._logo_dialog.setAcceptMode(QFileDialog.AcceptOpen)
+            self._logo_dialog.setFileMode(QFileDialog.ExistingFile)
         
-        if file_path:
-            self.logo_path_input.setText(file_path)
+        if self._logo_dialog.exec_():
+            file_paths = self._logo_dialog.selectedFiles()
+            if file_paths:
+                self.logo_path_input.setText(file_paths[0])
     
     def get_qrcode_options(self):
         """获取二维码生成选项"""
         # 获取纠错级别
         error_correction_code = self.error_correction_combo.currentData()
-        error_correction = QRCodeGenerator.ERROR_CORRECTION_LEVELS[error_correction_code]['value']
+        _, _, error_correction = self._ecc_cache[error_correction_code]
         
         options = {
             'version': self.version_spin.value(),
             'error_correction': error_correction,
             'box_size': self.box_size_spin.value(),
             'border': self.border_spin.value(),
-            'fill_color': self.foreground_color.name(),
-            'back_color': self.background_color.name(),
+            'fill_color': self.foreground_color_hex,
+            'back_color': self.background_color_hex,
         }
         
         # Logo设置
         if self.add_logo_checkbox.isChecked():
             options['add_logo'] = True
-            options['logo_path'] = self.logo_path_input.text()
+            options['logo_path'] = self.logo_path_input.text().strip()
             options['logo_size'] = (self.logo_size_spin.value(), self.logo_size_spin.value())
         else:
             options['add_logo'] = False
@@ -522,10 +509,10 @@ class QRCodeTab(QWidget):
         # 文本设置
         if self.add_text_checkbox.isChecked():
             options['add_text'] = True
-            options['text'] = self.text_input.text()
+            options['text'] = self.text_input.text().strip()
             options['text_position'] = 'top' if self.text_position_combo.currentIndex() == 0 else 'bottom'
             options['text_font_size'] = self.text_font_size_spin.value()
-            options['text_color'] = self.text_color.name()
+            options['text_color'] = self.text_color_hex
         else:
             options['add_text'] = False
         
@@ -541,80 +528,28 @@ class QRCodeTab(QWidget):
                 app_logger.warning("二维码数据为空")
                 return
             
-            # 获取基本参数
-            version = self.version_spin.value()
-            error_correction_code = self.error_correction_combo.currentData()
-            error_correction = QRCodeGenerator.ERROR_CORRECTION_LEVELS[error_correction_code]['value']
-            box_size = self.box_size_spin.value()
-            border = self.border_spin.value()
-            
-            # 获取颜色参数
-            fg_color = self.foreground_color.name()
-            bg_color = self.background_color.name()
-            
-            # 获取Logo参数
-            logo_path = self.logo_path_input.text().strip() if self.add_logo_checkbox.isChecked() else ""
-            logo_size = self.logo_size_spin.value() if self.add_logo_checkbox.isChecked() else 0
-            
-            # 获取文本参数
-            add_text = self.add_text_checkbox.isChecked()
-            text_content = self.text_input.text().strip() if add_text else ""
-            text_position = 'top' if self.text_position_combo.currentIndex() == 0 else 'bottom'
-            text_font_size = self.text_font_size_spin.value() if add_text else 0
-            text_color = self.text_color.name() if add_text else "#000000"
+            # 获取生成选项
+            options = self.get_qrcode_options()
             
             # 验证Logo文件是否存在
-            if self.add_logo_checkbox.isChecked() and logo_path and not os.path.exists(logo_path):
+            logo_path = options.get('logo_path')
+            if logo_path and not os.path.exists(logo_path):
                 self.status_updated.emit("Logo文件不存在")
                 app_logger.error(f"Logo文件不存在: {logo_path}")
                 return
             
             # 生成二维码
-            app_logger.info(f"开始生成二维码: 版本={version}, 纠错级别={error_correction_code}, 数据长度={len(data)}")
+            app_logger.info(f"开始生成二维码: 版本={options['version']}, 纠错级别={self.error_correction_combo.currentData()}, 数据长度={len(data)}")
             self.status_updated.emit("正在生成二维码...")
             
-            options = {
-                'version': version,
-                'error_correction': error_correction,
-                'box_size': box_size,
-                'border': border,
-                'fill_color': fg_color,
-                'back_color': bg_color,
-            }
-            
-            if self.add_logo_checkbox.isChecked():
-                options['add_logo'] = True
-                options['logo_path'] = logo_path
-                options['logo_size'] = (logo_size, logo_size)
-            else:
-                options['add_logo'] = False
-            
-            if add_text:
-                options['add_text'] = True
-                options['text'] = text_content
-                options['text_position'] = text_position
-                options['text_font_size'] = text_font_size
-                options['text_color'] = text_color
-            else:
-                options['add_text'] = False
-            
-            self.current_qrcode_image = self.qrcode_generator.generate_qrcode(data, options)
+            # 在线程池中生成，生成期间禁用生成按钮防止重复提交
+            worker = QRCodeGenerateWorker(self.qrcode_generator, data, options)
+            self.generate_signals = worker.signals
+            self.generate_signals.qrcode_ready.connect(self._on_qrcode_ready)
+            self.generate_signals.error_occurred.connect(self._on_qrcode_error)
             
-            if self.current_qrcode_image:
-                # 显示二维码
-                self.display_qrcode(self.current_qrcode_image)
-                
-                # 更新信息
-                self.update_qrcode_info(data)
-                
-                # 启用保存按钮
-                self.save_btn.setEnabled(True)
-                
-                self.status_updated.emit("二维码生成成功")
-                app_logger.info("二维码生成成功")
-            else:
-                self.status_updated.emit("生成二维码失败")
-                app_logger.error("生成二维码失败: 返回图像为空")
+            self.generate_btn.setEnabled(False)
+            QThreadPool.globalInstance().start(worker)
                 
         except ValueError as e:
             error_msg = f"二维码数据验证失败: {str(e)}"
@@ -633,33 +568,64 @@ class QRCodeTab(QWidget):
             self.status_updated.emit(error_msg)
             app_logger.error(error_msg)
     
-    def display_qrcode(self, qrcode_image):
-        """显示二维码图像"""
-        # 将PIL图像转换为QPixmap
-        width, height = qrcode_image.size
-        q_image = qrcode_image.toqimage()
-        pixmap = QPixmap.fromImage(q_image)
-        
-        # 缩放图像以适应预览区域
-        scaled_pixmap = pixmap.scaled(
-            self.preview_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        
-        # 显示图像
-        self.preview_label.setPixmap(scaled_pixmap)
-    
-    def update_qrcode_info(self, data):
-        """更新二维码信息"""
-        error_correction_code = self.error_correction_combo.currentData()
-        error_correction_info = QRCodeGenerator.ERROR_CORRECTION_LEVELS[error_correction_code]
+    @pyqtSlot(object, QImage, str, dict)
+    def _on_qrcode_ready(self, image, q_image, data, options):
+        """二维码生成完成"""
+        self.generate_signals = None
+        self.generate_btn.setEnabled(True)
+        self.current_qrcode_image = image
         
-        info_text = f"二维码数据: {data}\n"
-        info_text += f"版本: {self.version_spin.value()}\n"
-        info_text += f"纠错级别: {error_correction_info['name']} - {error_correction_info['description']}"
+        if self.current_qrcode_image:
+            # 只在生成时转换一次PIL图像，之后缩放都复用该预览图
+            self._source_pixmap = QPixmap.fromImage(q_image)
+            
+            # 显示二维码
+            self.display_qrcode()
+            
+            # 更新信息（使用生成时的选项，生成期间控件可能已被修改）
+            self.update_qrcode_info(data, options)
+            
+            # 启用保存按钮
+            self.save_btn.setEnabled(True)
+            
+            self.status_updated.emit("二维码生成成功")
+            app_logger.info("二维码生成成功")
+        else:
+            self.status_updated.emit("生成二维码失败")
+            app_logger.error("生成二维码失败: 返回图像为空")
+    
+    @pyqtSlot(str)
+    def _on_qrcode_error(self, error_msg):
+        """二维码生成失败"""
+        self.generate_signals = None
+        self.generate_btn.setEnabled(True)
+        self.status_updated.emit(error_msg)
+    
+    def display_qrcode(self):
+        """在预览区域显示缓存的二维码图像"""
+        if self._source_pixmap is None:
+            return
         
-        self.info_text.setText(info_text)
+        if not self.isVisible():
+            self._needs_rescale = True
+            return
+        
+        self._needs_rescale = False
+        self.preview_label.set_source_pixmap(self._source_pixmap)
+    
+    def update_qrcode_info(self, data, options):
+        """
+        更新二维码信息
+        
+        Args:
+            data (str): 二维码数据
+            options (dict): 生成该二维码时使用的选项
+        """
+        name, description = self._ecc_info_by_value[options['error_correction']]
+        
+        self.info_text.setText(self._INFO_TEMPLATE.format(
+            data=data, version=options['version'], name=name, desc=description
+        ))
     
     def save_qrcode(self):
         """保存二维码"""
@@ -670,12 +636,20 @@ class QRCodeTab(QWidget):
                 return
             
             # 获取保存路径
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "保存二维码",
-                os.path.join(os.getcwd(), "qrcode.png"),
-                "PNG图像 (*.png);;JPEG图像 (*.jpg);;BMP图像 (*.bmp);;所有文件 (*)"
-            )
+            if self._save_dialog is None:
+                self._save_dialog = QFileDialog(
+                    self,
+                    "保存二维码",
+                    os.getcwd(),
+                    "PNG图像 (*.png);;JPEG图像 (*.jpg);;BMP图像 (*.bmp);;所有文件 (*)"
+                )
+                self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+                self._save_dialog.selectFile("qrcode.png")
+            
+            file_path = ""
+            if self._save_dialog.exec_():
+                file_paths = self._save_dialog.selectedFiles()
+                file_path = file_paths[0] if file_paths else ""
             
             if not file_path:
                 app_logger.info("用户取消了保存操作")
@@ -708,10 +682,10 @@ class QRCodeTab(QWidget):
             self.status_updated.emit(error_msg)
             app_logger.error(error_msg)
     
-    def resizeEvent(self, event):
-        """窗口大小改变事件"""
-        super().resizeEvent(event)
+    def showEvent(self, event):
+        """显示事件"""
+        super().showEvent(event)
         
-        # 如果有二维码图像，重新显示以适应新的大小
-        if self.current_qrcode_image:
-            self.display_qrcode(self.current_qrcode_image)
\ No newline at end of file
+        # 隐藏期间生成的二维码在显示时再更新预览
+        if self._needs_rescale:
+            self.display_qrcode()
@@ -9,11 +9,18 @@ from PyQt5.QtWidgets import QMessageBox
 from utils.logger import app_logger
 
 
+# 已安装的异常钩子带有该标记属性，模块被重新加载后仍能识别，保证只安装一次
+_HOOK_MARKER = '_global_exception_hook'
+
+
 class GlobalExceptionHandler:
     """全局异常处理器"""
     
     def __init__(self):
         """初始化全局异常处理器"""
+        if getattr(sys.excepthook, _HOOK_MARKER, False):
+            return
+        
         # 安装异常钩子
         sys.excepthook = self.handle_exception
         
@@ -29,12 +36,15 @@ class GlobalExceptionHandler:
             exc_traceback: 异常回溯信息
         """
         # 记录异常信息到日志
-        error_msg = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-        app_logger.error(f"未捕获的异常:\n{error_msg}")
+        parts = ["未捕获的异常:\n"]
+        parts.extend(traceback.TracebackException(exc_type, exc_value, exc_traceback).format())
+        app_logger.error("".join(parts))
         
         # 显示错误对话框
         self.show_error_dialog(exc_type.__name__, str(exc_value))
     
+    setattr(handle_exception, _HOOK_MARKER, True)
+    
     def show_error_dialog(self, error_type, error_message):
         """
         显示错误对话框
@@ -4,38 +4,205 @@
 """
 
 import os
+import io
 import csv
+import stat
 import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import math
+import logging
+import mmap
+import codecs
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterable, Iterator, Sequence
 from .logger import app_logger
 
+# 优先使用orjson序列化JSON，未安装时回退到标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 本进程中已确认存在的目录（批量处理时会从工作线程调用，需加锁）
+_known_dirs: Set[str] = set()
+_known_dirs_lock = threading.Lock()
+
+# 超过该大小的CSV文件一次性读入时给出警告，建议改用流式读取
+_LARGE_CSV_WARN_SIZE = 50 << 20
+
+# 按秒缓存的时间戳字符串: [秒数, 格式化结果]
+_ts_cache = [0, ""]
+
+# 读写文件时默认使用的缓冲区大小（每个打开的文件会多占用相应的内存）
+_DEFAULT_BUFFERING = 1 << 20
+
+# 超过该大小的文件通过内存映射读取
+_MMAP_THRESHOLD = 16 << 20
+
+# 文件保存次数统计，由flush_stats汇总输出
+_save_stats = {"ok": 0, "fail": 0}
+_save_stats_lock = threading.Lock()
+
+# 目录文件名缓存: 目录 -> (目录修改时间, 文件名集合)，目录修改时间变化后重新列出
+_dir_names_cache: Dict[str, Tuple[int, Set[str]]] = {}
+
+# 各目录中每组文件名下次查找可用编号的起点: 目录 -> {(文件名, 扩展名): 编号}，
+# 目录重新列出时清除（可能有文件被删除，需要从头查找最小的可用编号）
+_unique_name_hints: Dict[str, Dict[Tuple[str, str], int]] = {}
+
+# 文件状态缓存: 路径 -> (缓存时间, stat结果)，stat结果为None表示路径不存在
+_stat_cache: Dict[str, Tuple[float, Optional[os.stat_result]]] = {}
+_STAT_TTL = 1.0
+
+
+class CSVIter:
+    """CSV行迭代器，逐行产出字典，迭代结束或退出with块时关闭文件"""
+    
+    def __init__(self, fp, reader):
+        """
+        初始化CSV行迭代器
+        
+        Args:
+            fp: 已打开的文件对象
+            reader: 基于该文件的csv.DictReader
+        """
+        self._fp = fp
+        self._reader = reader
+    
+    @property
+    def fieldnames(self) -> Optional[List[str]]:
+        """CSV表头字段"""
+        return self._reader.fieldnames
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        try:
+            yield from self._reader
+        finally:
+            self.close()
+    
+    def close(self) -> None:
+        """关闭文件"""
+        self._fp.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
 
 class FileHandler:
     """文件处理工具类"""
     
     @staticmethod
-    def ensure_dir_exists(dir_path: str) -> bool:
+    def ensure_dir_exists(dir_path: str, refresh: bool = False) -> bool:
         """
         确保目录存在，如果不存在则创建
         
         Args:
             dir_path (str): 目录路径
+            refresh (bool): 是否忽略已确认目录的缓存重新检查，用于目录可能已被删除时
             
         Returns:
             bool: 操作是否成功
         """
+        if refresh:
+            _known_dirs.discard(dir_path)
+        elif dir_path in _known_dirs:
+            return True
+        
         try:
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-                app_logger.info(f"创建目录: {dir_path}")
+            with _known_dirs_lock:
+                if dir_path in _known_dirs:
+                    return True
+                
+                # 直接尝试创建，已存在时由FileExistsError判断，省去单独的存在性检查
+                try:
+                    os.makedirs(dir_path)
+                    FileHandler._invalidate_stat(dir_path)
+                    app_logger.info("创建目录: %s", dir_path)
+                except FileExistsError:
+                    # 路径已存在说明缓存的状态可能已过期，直接查询文件系统
+                    FileHandler._invalidate_stat(dir_path)
+                    if not stat.S_ISDIR(os.stat(dir_path).st_mode):
+                        raise
+                _known_dirs.add(dir_path)
             return True
         except Exception as e:
-            app_logger.error(f"创建目录失败: {dir_path}, 错误: {str(e)}")
+            app_logger.error("创建目录失败: %s, 错误: %s", dir_path, e)
             return False
     
     @staticmethod
-    def save_file(file_path: str, content: str, encoding: str = 'utf-8') -> bool:
+    @contextmanager
+    def _atomic_open(file_path: str, mode: str, durable: bool = False, **kwargs):
+        """
+        先写入同目录下的临时文件，成功后再原子替换目标文件，写入中断时不会留下不完整的文件
+        
+        Args:
+            file_path (str): 目标文件路径
+            mode (str): 打开模式
+            durable (bool): 是否在替换前调用fsync
+            **kwargs: 其他传给open的参数
+        """
+        tmp_path = f"{file_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            f = open(tmp_path, mode, **kwargs)
+        except FileNotFoundError:
+            # 目录可能在确认存在后被删除，重新创建后重试一次
+            dir_path = os.path.dirname(file_path)
+            if not dir_path or not FileHandler.ensure_dir_exists(dir_path, refresh=True):
+                raise
+            f = open(tmp_path, mode, **kwargs)
+        
+        try:
+            with f:
+                yield f
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    @staticmethod
+    def prepare_dirs(paths: Iterable[str]) -> bool:
+        """
+        批量处理前一次性创建所有输出文件的父目录
+        
+        每个不同的目录只创建一次，之后的保存操作直接命中已确认目录的缓存。
+        
+        Args:
+            paths (Iterable[str]): 输出文件路径
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        parents = {os.path.dirname(p) for p in paths}
+        parents.discard('')
+        
+        try:
+            with _known_dirs_lock:
+                for dir_path in parents - _known_dirs:
+                    os.makedirs(dir_path, exist_ok=True)
+                    FileHandler._invalidate_stat(dir_path)
+                    _known_dirs.add(dir_path)
+            return True
+        except Exception as e:
+            app_logger.error("批量创建目录失败, 错误: %s", e)
+            return False
+    
+    @staticmethod
+    def save_file(file_path: str, content: str, encoding: str = 'utf-8',
+                  buffering: int = _DEFAULT_BUFFERING, durable: bool = False,
+                  quiet: bool = False) -> bool:
         """
         保存文本内容到文件
         
@@ -43,80 +210,304 @@ class FileHandler:
             file_path (str): 文件路径
             content (str): 文件内容
             encoding (str): 文件编码，默认为utf-8
+            buffering (int): 文件缓冲区大小，默认1MB以减少大文件的写入次数；写小文件时可传-1使用系统默认值
+            durable (bool): 是否在替换目标文件前调用fsync确保数据落盘，默认不调用
+            quiet (bool): 是否不记录成功日志（错误仍会记录），批量写入时可配合flush_stats汇总输出
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        dir_path, basename = os.path.split(file_path)
+        return FileHandler.save_into(dir_path, basename, content, encoding, buffering, durable, quiet)
+    
+    @staticmethod
+    def save_into(dir_path: str, basename: str, content: str, encoding: str = 'utf-8',
+                  buffering: int = _DEFAULT_BUFFERING, durable: bool = False,
+                  quiet: bool = False) -> bool:
+        """
+        保存文本内容到指定目录下的文件
+        
+        批量写入同一目录时，调用方只需拆分一次目录，不必每次再从完整路径中解析。
+        
+        Args:
+            dir_path (str): 目录路径，为空时表示当前目录
+            basename (str): 文件名
+            content (str): 文件内容
+            encoding (str): 文件编码，默认为utf-8
+            buffering (int): 文件缓冲区大小，默认1MB以减少大文件的写入次数；写小文件时可传-1使用系统默认值
+            durable (bool): 是否在替换目标文件前调用fsync确保数据落盘，默认不调用
+            quiet (bool): 是否不记录成功日志（错误仍会记录），批量写入时可配合flush_stats汇总输出
             
         Returns:
             bool: 操作是否成功
         """
+        file_path = os.path.join(dir_path, basename) if dir_path else basename
         try:
             # 确保目录存在
-            dir_path = os.path.dirname(file_path)
             if dir_path and not FileHandler.ensure_dir_exists(dir_path):
+                FileHandler._record_save(False)
                 return False
                 
-            with open(file_path, 'w', encoding=encoding) as f:
+            with FileHandler._atomic_open(file_path, 'w', durable, encoding=encoding, buffering=buffering) as f:
                 f.write(content)
-            app_logger.info(f"文件保存成功: {file_path}")
+            FileHandler._note_written(file_path)
+            FileHandler._record_save(True)
+            if not quiet and app_logger.isEnabledFor(logging.INFO):
+                app_logger.info("文件保存成功: %s", file_path)
             return True
         except Exception as e:
-            app_logger.error(f"文件保存失败: {file_path}, 错误: {str(e)}")
+            FileHandler._record_save(False)
+            app_logger.error("文件保存失败: %s, 错误: %s", file_path, e)
             return False
     
     @staticmethod
-    def read_file(file_path: str, encoding: str = 'utf-8') -> Optional[str]:
+    def read_file(file_path: str, encoding: str = 'utf-8', quiet: bool = False) -> Optional[str]:
         """
         读取文件内容
         
+        普通文件按文件大小一次读入后整体解码，超过16MB的文件通过内存映射读取；
+        大小为0或不是普通文件时（如/proc下的文件、管道）读到文件末尾为止。
+        换行符与文本模式读取一致，统一转换为\n。
+        
         Args:
             file_path (str): 文件路径
             encoding (str): 文件编码，默认为utf-8
+            quiet (bool): 是否不记录成功日志（错误仍会记录）
             
         Returns:
             Optional[str]: 文件内容，如果失败则返回None
         """
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            app_logger.info(f"文件读取成功: {file_path}")
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                st = os.fstat(fd)
+                size = st.st_size
+                if size == 0 or not stat.S_ISREG(st.st_mode):
+                    # 无法预知大小，分块读到文件末尾
+                    chunks = []
+                    while True:
+                        chunk = os.read(fd, _DEFAULT_BUFFERING)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                    content = b"".join(chunks).decode(encoding)
+                elif size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                        content = codecs.decode(mm, encoding)
+                else:
+                    chunks = []
+                    remaining = size
+                    while remaining > 0:
+                        chunk = os.read(fd, remaining)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                        remaining -= len(chunk)
+                    content = b"".join(chunks).decode(encoding)
+            finally:
+                os.close(fd)
+            
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            if not quiet and app_logger.isEnabledFor(logging.INFO):
+                app_logger.info("文件读取成功: %s", file_path)
             return content
         except Exception as e:
-            app_logger.error(f"文件读取失败: {file_path}, 错误: {str(e)}")
+            app_logger.error("文件读取失败: %s, 错误: %s", file_path, e)
             return None
     
     @staticmethod
-    def read_csv(file_path: str, delimiter: str = ',', encoding: str = 'utf-8') -> Optional[List[Dict[str, Any]]]:
+    def read_csv(file_path: str, delimiter: str = ',', encoding: str = 'utf-8',
+                 ascii_fast: bool = False) -> Optional[List[Dict[str, Any]]]:
         """
         读取CSV文件
         
+        所有记录会一次性载入内存，大文件请使用read_csv_stream。
+        
         Args:
             file_path (str): 文件路径
             delimiter (str): 分隔符，默认为逗号
             encoding (str): 文件编码，默认为utf-8
+            ascii_fast (bool): 调用方确定内容为纯ASCII时（如条码数据）可设为True，
+                改用latin-1解码以减少解码开销；含非ASCII字符时结果会出现乱码
             
         Returns:
             Optional[List[Dict[str, Any]]]: CSV数据，如果失败则返回None
         """
+        if ascii_fast:
+            encoding = 'latin-1'
+        
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
+            file_size = os.path.getsize(file_path)
+            if file_size > _LARGE_CSV_WARN_SIZE:
+                app_logger.warning("CSV文件较大(%s字节)，将整体载入内存，建议使用read_csv_stream: %s",
+                                   file_size, file_path)
+            
+            # 以二进制方式打开并使用较大的缓冲区，再包装为文本流交给csv模块
+            with open(file_path, 'rb', buffering=_DEFAULT_BUFFERING) as raw, \
+                    io.TextIOWrapper(raw, encoding=encoding, newline='') as f:
                 reader = csv.DictReader(f, delimiter=delimiter)
                 data = list(reader)
-            app_logger.info(f"CSV文件读取成功: {file_path}, 记录数: {len(data)}")
+            app_logger.info("CSV文件读取成功: %s, 记录数: %s", file_path, len(data))
             return data
         except Exception as e:
-            app_logger.error(f"CSV文件读取失败: {file_path}, 错误: {str(e)}")
+            app_logger.error("CSV文件读取失败: %s, 错误: %s", file_path, e)
+            return None
+    
+    @staticmethod
+    def read_csv_stream(file_path: str, delimiter: str = ',', encoding: str = 'utf-8') -> Optional['CSVIter']:
+        """
+        流式读取CSV文件，逐行产出字典，不把整个文件载入内存
+        
+        Args:
+            file_path (str): 文件路径
+            delimiter (str): 分隔符，默认为逗号
+            encoding (str): 文件编码，默认为utf-8
+            
+        Returns:
+            Optional[CSVIter]: CSV行迭代器，如果失败则返回None
+        """
+        try:
+            f = open(file_path, 'r', newline='', encoding=encoding)
+            return CSVIter(f, csv.DictReader(f, delimiter=delimiter))
+        except Exception as e:
+            app_logger.error("CSV文件读取失败: %s, 错误: %s", file_path, e)
+            return None
+    
+    @staticmethod
+    def read_csv_df(file_path: str, delimiter: str = ',', encoding: str = 'utf-8',
+                    dtype: Optional[Dict[str, Any]] = None, chunksize: Optional[int] = None, **kwargs):
+        """
+        使用pandas读取CSV文件，适合大文件
+        
+        Args:
+            file_path (str): 文件路径
+            delimiter (str): 分隔符，默认为逗号
+            encoding (str): 文件编码，默认为utf-8
+            dtype (Optional[Dict[str, Any]]): 列类型，指定后pandas无需再推断类型
+            chunksize (Optional[int]): 分块行数，指定后返回按块迭代的读取器
+            **kwargs: 其他传给pandas.read_csv的参数
+            
+        Returns:
+            DataFrame或TextFileReader，如果失败则返回None
+        """
+        try:
+            import pandas as pd
+            return pd.read_csv(file_path, sep=delimiter, encoding=encoding,
+                               dtype=dtype, chunksize=chunksize, **kwargs)
+        except Exception as e:
+            app_logger.error("CSV文件读取失败: %s, 错误: %s", file_path, e)
+            return None
+    
+    @staticmethod
+    def read_csv_columns(file_path: str, delimiter: str = ',',
+                         encoding: str = 'utf-8') -> Optional[Dict[str, Any]]:
+        """
+        使用pyarrow按列读取CSV文件
+        
+        返回按列存储的数据，只需处理某一列时（如条码数据列）无需逐行查找字典，
+        例如 columns['barcode'].to_pylist()。需要安装pyarrow。
+        
+        Args:
+            file_path (str): 文件路径
+            delimiter (str): 分隔符，默认为逗号
+            encoding (str): 文件编码，默认为utf-8
+            
+        Returns:
+            Optional[Dict[str, Any]]: 列名到pyarrow列数据的映射，如果失败则返回None
+        """
+        try:
+            import pyarrow.csv as pacsv
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(encoding=encoding),
+                parse_options=pacsv.ParseOptions(delimiter=delimiter)
+            )
+            app_logger.info("CSV文件读取成功: %s, 记录数: %s", file_path, table.num_rows)
+            return {name: table.column(name) for name in table.column_names}
+        except Exception as e:
+            app_logger.error("CSV文件读取失败: %s, 错误: %s", file_path, e)
             return None
     
     @staticmethod
-    def save_csv(file_path: str, data: List[Dict[str, Any]], fieldnames: List[str] = None, 
-                 delimiter: str = ',', encoding: str = 'utf-8') -> bool:
+    def iter_csv_rows(file_path: str, delimiter: str = ',', encoding: str = 'utf-8') -> Iterator[List[str]]:
+        """
+        逐行读取CSV文件，每行返回字段列表，不为每行构建字典，也不整体载入内存
+        
+        读取出错时异常会在迭代过程中抛给调用方。
+        
+        Args:
+            file_path (str): 文件路径
+            delimiter (str): 分隔符，默认为逗号
+            encoding (str): 文件编码，默认为utf-8
+            
+        Returns:
+            Iterator[List[str]]: 按行产出的字段列表（第一行为表头）
+        """
+        with open(file_path, 'r', newline='', encoding=encoding) as f:
+            yield from csv.reader(f, delimiter=delimiter)
+    
+    @staticmethod
+    def save_csv_rows(file_path: str, header: Sequence[str], rows: Iterable[Sequence[Any]],
+                      delimiter: str = ',', encoding: str = 'utf-8',
+                      buffering: int = _DEFAULT_BUFFERING, durable: bool = False,
+                      quiet: bool = False) -> bool:
+        """
+        按位置写出CSV文件，不需要把每行数据组织成字典
+        
+        Args:
+            file_path (str): 文件路径
+            header (Sequence[str]): 表头
+            rows (Iterable[Sequence[Any]]): 数据行，可以是生成器
+            delimiter (str): 分隔符，默认为逗号
+            encoding (str): 文件编码，默认为utf-8
+            buffering (int): 文件缓冲区大小，默认1MB以减少大文件的写入次数；写小文件时可传-1使用系统默认值
+            durable (bool): 是否在替换目标文件前调用fsync确保数据落盘，默认不调用
+            quiet (bool): 是否不记录成功日志（错误仍会记录），批量写入时可配合flush_stats汇总输出
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 确保目录存在
+            dir_path = os.path.dirname(file_path)
+            if dir_path and not FileHandler.ensure_dir_exists(dir_path):
+                FileHandler._record_save(False)
+                return False
+            
+            counter = itertools.count()
+            with FileHandler._atomic_open(file_path, 'w', durable, newline='', encoding=encoding,
+                                          buffering=buffering) as f:
+                writer = csv.writer(f, delimiter=delimiter)
+                writer.writerow(header)
+                writer.writerows(row for row, _ in zip(rows, counter))
+            FileHandler._note_written(file_path)
+            FileHandler._record_save(True)
+            if not quiet and app_logger.isEnabledFor(logging.INFO):
+                app_logger.info("CSV文件保存成功: %s, 记录数: %s", file_path, next(counter))
+            return True
+        except Exception as e:
+            FileHandler._record_save(False)
+            app_logger.error("CSV文件保存失败: %s, 错误: %s", file_path, e)
+            return False
+    
+    @staticmethod
+    def save_csv(file_path: str, data: Iterable[Dict[str, Any]], fieldnames: List[str] = None, 
+                 delimiter: str = ',', encoding: str = 'utf-8',
+                 buffering: int = _DEFAULT_BUFFERING, durable: bool = False,
+                 quiet: bool = False) -> bool:
         """
         保存数据到CSV文件
         
         Args:
             file_path (str): 文件路径
-            data (List[Dict[str, Any]]): 要保存的数据
+            data (Iterable[Dict[str, Any]]): 要保存的数据，可以是生成器，按行写出不会整体载入内存
             fieldnames (List[str]): 字段名列表，如果为None则使用第一行数据的键
             delimiter (str): 分隔符，默认为逗号
             encoding (str): 文件编码，默认为utf-8
+            buffering (int): 文件缓冲区大小，默认1MB以减少大文件的写入次数；写小文件时可传-1使用系统默认值
+            durable (bool): 是否在替换目标文件前调用fsync确保数据落盘，默认不调用
+            quiet (bool): 是否不记录成功日志（错误仍会记录），批量写入时可配合flush_stats汇总输出
             
         Returns:
             bool: 操作是否成功
@@ -125,22 +516,166 @@ class FileHandler:
             # 确保目录存在
             dir_path = os.path.dirname(file_path)
             if dir_path and not FileHandler.ensure_dir_exists(dir_path):
+                FileHandler._record_save(False)
                 return False
                 
-            # 如果没有提供字段名，使用第一行数据的键
-            if not fieldnames and data:
-                fieldnames = list(data[0].keys())
-                
-            with open(file_path, 'w', newline='', encoding=encoding) as f:
+            # 取出第一行，如果没有提供字段名，使用第一行数据的键
+            rows = iter(data)
+            first = next(rows, None)
+            if not fieldnames and first is not None:
+                fieldnames = list(first.keys())
+            if first is not None:
+                rows = itertools.chain([first], rows)
+            
+            # 边写边计数，写完后计数器的下一个值即为记录数
+            counter = itertools.count()
+            with FileHandler._atomic_open(file_path, 'w', durable, newline='', encoding=encoding,
+                                          buffering=buffering) as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter)
                 writer.writeheader()
-                writer.writerows(data)
-            app_logger.info(f"CSV文件保存成功: {file_path}, 记录数: {len(data)}")
+                writer.writerows(row for row, _ in zip(rows, counter))
+            FileHandler._note_written(file_path)
+            FileHandler._record_save(True)
+            if not quiet and app_logger.isEnabledFor(logging.INFO):
+                app_logger.info("CSV文件保存成功: %s, 记录数: %s", file_path, next(counter))
             return True
         except Exception as e:
-            app_logger.error(f"CSV文件保存失败: {file_path}, 错误: {str(e)}")
+            FileHandler._record_save(False)
+            app_logger.error("CSV文件保存失败: %s, 错误: %s", file_path, e)
             return False
     
+    @staticmethod
+    def save_json(file_path: str, obj: Any, buffering: int = _DEFAULT_BUFFERING,
+                  durable: bool = False, quiet: bool = False) -> bool:
+        """
+        保存数据到JSON文件（UTF-8编码）
+        
+        Args:
+            file_path (str): 文件路径
+            obj (Any): 要保存的数据
+            buffering (int): 文件缓冲区大小，默认1MB以减少大文件的写入次数；写小文件时可传-1使用系统默认值
+            durable (bool): 是否在替换目标文件前调用fsync确保数据落盘，默认不调用
+            quiet (bool): 是否不记录成功日志（错误仍会记录），批量写入时可配合flush_stats汇总输出
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 确保目录存在
+            dir_path = os.path.dirname(file_path)
+            if dir_path and not FileHandler.ensure_dir_exists(dir_path):
+                FileHandler._record_save(False)
+                return False
+            
+            content = FileHandler._dumps_json(obj)
+            
+            with FileHandler._atomic_open(file_path, 'wb', durable, buffering=buffering) as f:
+                f.write(content)
+            FileHandler._note_written(file_path)
+            FileHandler._record_save(True)
+            if not quiet and app_logger.isEnabledFor(logging.INFO):
+                app_logger.info("JSON文件保存成功: %s", file_path)
+            return True
+        except Exception as e:
+            FileHandler._record_save(False)
+            app_logger.error("JSON文件保存失败: %s, 错误: %s", file_path, e)
+            return False
+    
+    @staticmethod
+    def _dumps_json(obj: Any) -> bytes:
+        """
+        将数据序列化为UTF-8编码的JSON，是否安装orjson不影响可接受的输入和输出结果
+        
+        非字符串的键转换为字符串，NaN和无穷大写为null（与orjson一致，保证输出是标准JSON）；
+        标准库也使用与orjson相同的紧凑格式（不含多余空格）。
+        
+        Args:
+            obj (Any): 要序列化的数据
+            
+        Returns:
+            bytes: JSON内容
+        """
+        # orjson直接输出UTF-8字节，无需再经过文本编码；超出64位的整数等orjson不支持的输入交给标准库
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+        
+        try:
+            content = json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+        except ValueError:
+            # 含有NaN或无穷大，替换为None后重新序列化
+            content = json.dumps(FileHandler._replace_non_finite(obj), ensure_ascii=False,
+                                 allow_nan=False, separators=(',', ':'))
+        return content.encode('utf-8')
+    
+    @staticmethod
+    def _replace_non_finite(obj: Any) -> Any:
+        """
+        将数据中的NaN和无穷大替换为None
+        
+        Args:
+            obj (Any): 数据
+            
+        Returns:
+            Any: 替换后的数据
+        """
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+        if isinstance(obj, dict):
+            return {key: FileHandler._replace_non_finite(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [FileHandler._replace_non_finite(value) for value in obj]
+        return obj
+    
+    @staticmethod
+    def read_json(file_path: str) -> Optional[Any]:
+        """
+        读取JSON文件
+        
+        Args:
+            file_path (str): 文件路径
+            
+        Returns:
+            Optional[Any]: JSON数据，如果失败则返回None
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            data = orjson.loads(content) if orjson is not None else json.loads(content)
+            app_logger.info("JSON文件读取成功: %s", file_path)
+            return data
+        except Exception as e:
+            app_logger.error("JSON文件读取失败: %s, 错误: %s", file_path, e)
+            return None
+    
+    @staticmethod
+    def _record_save(ok: bool) -> None:
+        """
+        记录一次文件保存结果
+        
+        Args:
+            ok (bool): 是否保存成功
+        """
+        with _save_stats_lock:
+            _save_stats["ok" if ok else "fail"] += 1
+    
+    @staticmethod
+    def flush_stats() -> Dict[str, int]:
+        """
+        汇总输出自上次调用以来的文件保存次数，并清零统计
+        
+        Returns:
+            Dict[str, int]: 成功和失败次数
+        """
+        with _save_stats_lock:
+            stats = dict(_save_stats)
+            _save_stats["ok"] = 0
+            _save_stats["fail"] = 0
+        app_logger.info("文件保存统计: 成功 %s, 失败 %s", stats["ok"], stats["fail"])
+        return stats
+    
     @staticmethod
     def get_unique_filename(base_path: str, extension: str = '') -> str:
         """
@@ -157,14 +692,129 @@ class FileHandler:
             extension = '.' + extension
             
         file_path = base_path + extension
-        counter = 1
+        dir_path, stem = os.path.split(base_path)
+        
+        # 一次列出目录中的文件名，之后在内存中查找可用的编号，并从上次找到的编号继续
+        names_dir = dir_path or '.'
+        try:
+            existing = FileHandler._list_dir_names(names_dir)
+        except FileNotFoundError:
+            existing = set()
         
-        while os.path.exists(file_path):
-            file_path = f"{base_path}_{counter}{extension}"
+        hint_key = (stem, extension)
+        counter = _unique_name_hints.get(names_dir, {}).get(hint_key, 0)
+        name = f"{stem}_{counter}{extension}" if counter else stem + extension
+        while name in existing:
             counter += 1
-            
+            name = f"{stem}_{counter}{extension}"
+        
+        file_path = os.path.join(dir_path, name) if dir_path else name
+        if not os.path.exists(file_path):
+            _unique_name_hints.setdefault(names_dir, {})[hint_key] = counter
+            return file_path
+        
+        # 缓存已过期，或文件系统不区分大小写（文件名集合中查不到），
+        # 重新列出目录后从当前编号起逐个确认，保证不返回已存在的路径
+        try:
+            existing = FileHandler._list_dir_names(names_dir, refresh=True)
+        except FileNotFoundError:
+            existing = set()
+        
+        while name in existing or os.path.exists(file_path):
+            counter += 1
+            name = f"{stem}_{counter}{extension}"
+            file_path = os.path.join(dir_path, name) if dir_path else name
+        
+        _unique_name_hints.setdefault(names_dir, {})[hint_key] = counter
         return file_path
     
+    @staticmethod
+    def _list_dir_names(dir_path: str, refresh: bool = False) -> Set[str]:
+        """
+        获取目录中的文件名集合，目录未修改时复用上次的结果
+        
+        Args:
+            dir_path (str): 目录路径
+            refresh (bool): 是否忽略缓存重新列出
+            
+        Returns:
+            Set[str]: 目录中的文件名
+        """
+        if refresh:
+            FileHandler._invalidate_stat(dir_path)
+        st = FileHandler._stat(dir_path)
+        if st is None:
+            raise FileNotFoundError(dir_path)
+        
+        mtime = st.st_mtime_ns
+        cached = _dir_names_cache.get(dir_path)
+        if not refresh and cached and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(dir_path) as entries:
+            names = {entry.name for entry in entries}
+        _dir_names_cache[dir_path] = (mtime, names)
+        _unique_name_hints.pop(dir_path, None)
+        return names
+    
+    @staticmethod
+    def _stat(path: str) -> Optional[os.stat_result]:
+        """
+        获取路径状态，短时间内重复查询同一路径时复用结果（包括路径不存在的结果）
+        
+        Args:
+            path (str): 路径
+            
+        Returns:
+            Optional[os.stat_result]: 路径状态，路径不存在时返回None
+        """
+        now = time.monotonic()
+        cached = _stat_cache.get(path)
+        if cached and now - cached[0] < _STAT_TTL:
+            return cached[1]
+        
+        try:
+            result = os.stat(path)
+        except FileNotFoundError:
+            result = None
+        _stat_cache[path] = (now, result)
+        return result
+    
+    @staticmethod
+    def _note_written(file_path: str) -> None:
+        """
+        更新写入文件后的缓存：把文件名加入目录文件名缓存并记录目录新的修改时间，
+        避免每次写入后都要重新列出整个目录
+        
+        Args:
+            file_path (str): 已写入的文件路径
+        """
+        _stat_cache.pop(file_path, None)
+        dir_path, basename = os.path.split(file_path)
+        dir_path = dir_path or '.'
+        _stat_cache.pop(dir_path, None)
+        
+        cached = _dir_names_cache.get(dir_path)
+        if cached is None:
+            return
+        st = FileHandler._stat(dir_path)
+        if st is None:
+            _dir_names_cache.pop(dir_path, None)
+            return
+        cached[1].add(basename)
+        _dir_names_cache[dir_path] = (st.st_mtime_ns, cached[1])
+    
+    @staticmethod
+    def _invalidate_stat(*paths: str) -> None:
+        """
+        清除路径的状态缓存，在写入或创建路径后调用
+        
+        Args:
+            *paths (str): 路径
+        """
+        for path in paths:
+            _stat_cache.pop(path, None)
+    
     @staticmethod
     def get_timestamp_filename(prefix: str = '', extension: str = '') -> str:
         """
@@ -177,8 +827,12 @@ class FileHandler:
         Returns:
             str: 带时间戳的文件名
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 同一秒内的调用复用已格式化的时间戳
+        now_s = int(time.time())
+        if now_s != _ts_cache[0]:
+            _ts_cache[:] = [now_s, time.strftime("%Y%m%d_%H%M%S", time.localtime(now_s))]
+        timestamp = _ts_cache[1]
         if extension and not extension.startswith('.'):
             extension = '.' + extension
             
-        return f"{prefix}_{timestamp}{extension}" if prefix else f"{timestamp}{extension}"
\ No newline at end of file
+        return f"{prefix}_{timestamp}{extension}" if prefix else f"{timestamp}{extension}"
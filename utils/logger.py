@@ -3,78 +3,127 @@
 提供应用程序的日志记录功能
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
 
+# 日志文件名中的日期，在模块加载时计算一次
+_TODAY = datetime.now().strftime('%Y%m%d')
+
+# 所有处理器共用的格式化器
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# 日志格式中不包含线程和进程信息，不必为每条记录收集
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
 class Logger:
     """日志记录器类，提供统一的日志记录接口"""
     
-    def __init__(self, name="BarcodeGenerator", log_level=logging.INFO):
+    __slots__ = ('logger', '_listener', '_queue_handler')
+    
+    def __init__(self, name="BarcodeGenerator", log_level=logging.INFO, log_dir=None):
         """
         初始化日志记录器
         
         Args:
             name (str): 日志记录器名称
             log_level (int): 日志级别
+            log_dir (str): 日志目录，默认为项目根目录下的logs
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(log_level)
+        self._listener = None
+        self._queue_handler = None
         
         # 避免重复添加处理器
         if not self.logger.handlers:
             # 创建日志目录
-            log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
+            if log_dir is None:
+                log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
             if not os.path.exists(log_dir):
                 os.makedirs(log_dir)
                 
-            # 创建文件处理器
-            log_file = os.path.join(log_dir, f"{name}_{datetime.now().strftime('%Y%m%d')}.log")
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            # 创建文件处理器（首次写入日志时才打开文件，单个文件超过64MB时轮转）
+            log_file = os.path.join(log_dir, f"{name}_{_TODAY}.log")
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=64 << 20, backupCount=5, encoding='utf-8', delay=True
+            )
             file_handler.setLevel(log_level)
             
             # 创建控制台处理器
             console_handler = logging.StreamHandler()
             console_handler.setLevel(log_level)
             
-            # 创建格式化器
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            
             # 设置格式化器
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
+            file_handler.setFormatter(_FORMATTER)
+            console_handler.setFormatter(_FORMATTER)
             
-            # 添加处理器
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+            # 通过队列转发日志记录，由后台线程负责格式化输出和写文件
+            log_queue = queue.Queue(-1)
+            self._queue_handler = logging.handlers.QueueHandler(log_queue)
+            self.logger.addHandler(self._queue_handler)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            self._listener.start()
+            
+            # 程序退出时写出队列中剩余的日志
+            atexit.register(self.close)
+    
+    def close(self):
+        """
+        停止后台日志线程，并写出队列中剩余的日志
+        
+        之后的日志记录直接交给文件和控制台处理器输出，不会因后台线程停止而丢失。
+        """
+        if self._listener is None:
+            return
+        
+        # 先摘下队列处理器，停止后台线程时会写出队列中剩余的记录
+        self.logger.removeHandler(self._queue_handler)
+        self._queue_handler = None
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            self.logger.addHandler(handler)
+        self._listener = None
+    
+    def isEnabledFor(self, level):
+        """判断指定级别的日志是否会被记录"""
+        return self.logger.isEnabledFor(level)
     
-    def debug(self, message):
+    def debug(self, message, *args):
         """记录调试信息"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def info(self, message):
+    def info(self, message, *args):
         """记录一般信息"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message):
+    def warning(self, message, *args):
         """记录警告信息"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message):
+    def error(self, message, *args):
         """记录错误信息"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message):
+    def critical(self, message, *args):
         """记录严重错误信息"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
     
-    def exception(self, message):
+    def exception(self, message, *args):
         """记录异常信息，包含堆栈跟踪"""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
 
 
 # 创建全局日志记录器实例